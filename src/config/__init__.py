@@ -3,22 +3,72 @@ This is a template project.
 This docstring should be replaced to describe the purpose of this project.
 """
 
+import importlib
+import typing as ty
+
 __version__ = "0.0.1"
 
-from config.types import (
-    Annotation,
-    Derived,
-    Dict,
-    Enum,
-    Optional,
-    Stateful,
-    Stateless,
-    Type,
-    List,
-    Literal,
-    Tuple,
-)
-
-from config.main import config
-
-from config.search_space.main import Distribution, CategoricalDistribution, SearchSpace
+if ty.TYPE_CHECKING:
+    from config.types import (
+        Annotation,
+        Derived,
+        Dict,
+        Enum,
+        Optional,
+        Stateful,
+        Stateless,
+        Type,
+        List,
+        Literal,
+        Tuple,
+    )
+
+    from config.main import config
+
+    from config.search_space.main import (
+        Distribution,
+        CategoricalDistribution,
+        SearchSpace,
+    )
+
+# The public names are imported lazily on first access (PEP 562), such that
+# importing a single sub-module does not load the entire package.
+_LAZY = {
+    "Annotation": "config.types",
+    "Derived": "config.types",
+    "Dict": "config.types",
+    "Enum": "config.types",
+    "Optional": "config.types",
+    "Stateful": "config.types",
+    "Stateless": "config.types",
+    "Type": "config.types",
+    "List": "config.types",
+    "Literal": "config.types",
+    "Tuple": "config.types",
+    "config": "config.main",
+    "Distribution": "config.search_space.main",
+    "CategoricalDistribution": "config.search_space.main",
+    "SearchSpace": "config.search_space.main",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> ty.Any:
+    if name not in _LAZY:
+        # the sub-modules, e.g. `config.main`, remain reachable after `import config`.
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,22 +1,63 @@
+import functools
+import os
+import typing as ty
+from collections import abc
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 
-def _repr(self):
-    return (
-        type(self).__name__
-        + "("
-        + ", ".join([
-            f"{k}='{v}'" if isinstance(v, str) else f"{k}={repr(v)}"
-            for k, v in self.to_dict(_repr=True).items()
-        ])
-        + ")"
-    )
+def _clean_key_pem(key_pem: str):
+    # escaped new-lines are left as they are, such that a single pass that escapes
+    # the raw new-lines is equivalent to un-escaping and then re-escaping everything.
+    if "\n" not in key_pem:
+        # already escaped
+        return key_pem
+    return key_pem.replace("\n", "\\n")
 
 
-def _clean_key_pem(key_pem: str):
-    return key_pem.replace("\\n", "\n").replace("\n", "\\n")
+@functools.lru_cache(maxsize=32)
+def _load_key(path_str: str, mtime_ns: int, size: int) -> str:
+    # `mtime_ns` and `size` are only part of the cache key, such that
+    # modifying the key file invalidates the cached value.
+    del mtime_ns, size
+    # the file is read to its end, as pipes and special files report a size of 0.
+    with open(path_str, "rb") as f:
+        data = f.read()
+    # equivalent to reading the file in text mode, i.e. with universal new-lines.
+    key_pem = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return _clean_key_pem(key_pem)
+
+
+def _invalid_key(key_file: Path | None, key_pem: str | None) -> str:
+    del key_file, key_pem
+    raise ValueError("Must only provide either `key_pem` or `key_file`.")
+
+
+def _key_from_file(key_file: Path | None, key_pem: str | None) -> str:
+    del key_pem
+    assert key_file is not None
+    path_str = os.fspath(key_file)
+    st = os.stat(path_str)
+    return _load_key(path_str, st.st_mtime_ns, st.st_size)
+
+
+def _key_from_pem(key_file: Path | None, key_pem: str | None) -> str:
+    del key_file
+    assert key_pem is not None
+    return _clean_key_pem(key_pem)
+
 
+# fixed values of the RClone configuration that are omitted from the representation.
+_FIXED = {"key_use_agent": "False", "type": "sftp"}
+_REPR_KEYS = ("host", "user", "port", "key_pem")
+_ALLOWED_KEYS = frozenset({"host", "user", "port", "key_pem", "key_file"})
 
+# indexed by `2 * (key_file is None) + (key_pem is None)`
+_KEY_LOADERS = (_invalid_key, _key_from_file, _key_from_pem, _invalid_key)
+
+
+@dataclass(frozen=True, init=False, repr=False)
 class ConfigClass:
     """
     The configuration for connecting to a remote storage via SSH.
@@ -40,8 +81,26 @@ class ConfigClass:
     ------
     ValueError
         When both `key_pem` and `key_file` are unspecified or specified.
+    ValueError
+        When `port` is not a valid port number.
     """
 
+    # the derived values are slots but not fields of the dataclass.
+    __slots__ = (
+        "host",
+        "user",
+        "port",
+        "key_pem",
+        "_port_str",
+        "_dict",
+        "_repr_dict",
+    )
+
+    host: str
+    user: str
+    port: int
+    key_pem: str
+
     def __init__(
         self,
         host: str,
@@ -49,21 +108,100 @@ class ConfigClass:
         port: int,
         key_pem: str | None = None,
         key_file: Path | None = None,
-        **_,
     ):
-        self.key_pem: str
-        if not (key_file is None) ^ (key_pem is None):
-            raise ValueError("Must only provide either `key_pem` or `key_file`.")
-        if key_file is not None:
-            self.key_pem = _clean_key_pem(key_file.read_text())
-        elif key_pem is not None:
-            self.key_pem = _clean_key_pem(key_pem)
-        self.host: str = host
-        self.user: str = user
-        self.port: int = port
+        self._init_fields(
+            host,
+            user,
+            port,
+            _KEY_LOADERS[2 * (key_file is None) + (key_pem is None)](key_file, key_pem),
+        )
+
+    def _init_fields(self, host: str, user: str, port: int, key_pem: str):
+        self._port_str: str
+        self._dict: dict[str, str]
+        self._repr_dict: dict[str, str]
+        # the dataclass is frozen and attributes are set via `object.__setattr__`
+        _set = functools.partial(object.__setattr__, self)
+        _set("key_pem", key_pem)
+        _set("host", host)
+        _set("user", user)
+        _set("port", int(port))
+        if not 0 < self.port < 65536:
+            raise ValueError(f"Invalid port number {port}.")
+        _set("_port_str", str(self.port))
+        _set(
+            "_repr_dict",
+            dict(zip(_REPR_KEYS, (self.host, self.user, self._port_str, self.key_pem))),
+        )
+        _set("_dict", {**self._repr_dict, **_FIXED})
+
+    def __getstate__(self) -> tuple[str, str, int, str]:
+        return self.host, self.user, self.port, self.key_pem
+
+    def __setstate__(self, state: tuple[str, str, int, str]):
+        # the derived values are not pickled but are recomputed.
+        self._init_fields(*state)
+
+    @classmethod
+    def from_mapping(cls, mapping: abc.Mapping[str, ty.Any]) -> "ConfigClass":
+        """
+        Create the configuration from a mapping, e.g. a parsed configuration file,
+        that can contain additional keys. Keys that are not arguments of the
+        configuration are ignored.
+
+        Parameters
+        ----------
+        mapping : abc.Mapping[str, ty.Any]
+            the mapping containing the arguments of the configuration.
+
+        Returns
+        -------
+        ConfigClass
+            the configuration object.
+        """
+        return cls(**{k: v for k, v in mapping.items() if k in _ALLOWED_KEYS})
+
+    @classmethod
+    def from_many(
+        cls, rows: abc.Iterable[abc.Mapping[str, ty.Any]]
+    ) -> list["ConfigClass"]:
+        """
+        Create several configurations at once, e.g. for many hosts of the same
+        configuration file. Each distinct ``key_file`` is read a single time and
+        keys that are not arguments of the configuration are ignored,
+        as in :meth:`from_mapping`.
+
+        Parameters
+        ----------
+        rows : abc.Iterable[abc.Mapping[str, ty.Any]]
+            the mappings containing the arguments of each configuration.
+
+        Returns
+        -------
+        list[ConfigClass]
+            the configuration objects in the same order as ``rows``.
+        """
+        key_pems: dict[Path, str] = {}
+        configs = []
+        for row in rows:
+            key_file, key_pem = row.get("key_file"), row.get("key_pem")
+            if key_file is not None and key_pem is None:
+                if key_file not in key_pems:
+                    key_pems[key_file] = _key_from_file(key_file, None)
+                key_pem = key_pems[key_file]
+            else:
+                key_pem = _KEY_LOADERS[2 * (key_file is None) + (key_pem is None)](
+                    key_file, key_pem
+                )
+            config = cls.__new__(cls)
+            config._init_fields(row["host"], row["user"], row["port"], key_pem)
+            configs.append(config)
+        return configs
 
     # pylint: disable=useless-type-doc,useless-param-doc
-    def to_dict(self, _repr: bool = False) -> dict[str, str]:
+    def to_dict(
+        self, _repr: bool = False, copy: bool = True
+    ) -> dict[str, str] | MappingProxyType[str, str]:
         """
         dictionary representation of the configuration
         that can be then parsed to be used for RClone.
@@ -73,24 +211,24 @@ class ConfigClass:
         _repr : bool
             Whether to return a dictionary representation that omits fixed
             internal values.
+        copy : bool
+            Whether to return a new dictionary. When ``False`` a read-only view
+            of the cached dictionary is returned, by default ``True``.
 
         Returns
         -------
-        dict[str, str]
+        dict[str, str] | MappingProxyType[str, str]
             the dictionary representation of the configuration.
         """
-        _dict = {
-            "host": self.host,
-            "user": self.user,
-            "port": str(self.port),
-            "key_pem": self.key_pem,
-            "key_use_agent": "False",
-            "type": "sftp",
-        }
-        if _repr:
-            del _dict["type"]
-            del _dict["key_use_agent"]
-        return _dict
+        _dict = self._repr_dict if _repr else self._dict
+        if not copy:
+            return MappingProxyType(_dict)
+        return dict(_dict)
 
     def __repr__(self) -> str:
-        return _repr(self)
+        # specialized to the fixed fields of the configuration, where all the values
+        # of `to_dict(_repr=True)` are strings.
+        return (
+            f"{type(self).__name__}(host='{self.host}', user='{self.user}',"
+            f" port='{self._port_str}', key_pem='{self.key_pem}')"
+        )
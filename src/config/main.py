@@ -1,9 +1,10 @@
-from collections import ChainMap, abc
-import copy
+from collections import abc
+import functools
 import inspect
 import logging
 import operator
 import typing as ty
+import weakref
 from typing import Any, Union
 from functools import partial
 from pathlib import Path
@@ -11,7 +12,17 @@ from typing_extensions import Self
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    # PyYAML is not compiled with libyaml
+    from yaml import (  # type: ignore[assignment]
+        SafeDumper as _SafeDumper,
+        SafeLoader as _SafeLoader,
+    )
+
 from config.types import (
+    ALLOWED_TYPES,
     Annotation,
     Derived,
     Dict,
@@ -26,7 +37,8 @@ from config.types import (
 )
 from config.utils import (
     augment_trial_kwargs,
-    dict_hash,
+    cache_per_class,
+    flat_dict_hash,
     flatten_nested_dict,
     parse_repr_to_kwargs,
 )
@@ -57,27 +69,69 @@ def config(cls: type) -> type:
     if "__init__" in cls.__dict__:
         raise ValueError("Can not over-ride protected function name `__init__`.")
 
-    for k, v in ConfigBase.__dict__.items():
-        if k not in cls.__dict__ and k != "__dict__":
+    has_repr = "__repr__" in cls.__dict__
+    for k, v in _CONFIGBASE_MEMBERS:
+        if k not in cls.__dict__:
             setattr(cls, k, v)
     setattr(cls, "config_class", cls)
     setattr(cls, "_class_name", cls.__name__)
+    if not has_repr:
+        setattr(cls, "__repr__", _make_repr(cls))
+    _non_annotated_variables(cls)
 
     return cls
 
 
-def _freeze_helper(obj):
-    def __setattr__(self, k, v):
-        if getattr(self, "_freeze", False):
-            raise RuntimeError(
-                f"Can not set attribute {k} on a class of a frozen configuration"
-                f" ``{type(self).__name__}``."
-            )
-        object.__setattr__(self, k, v)
+def _repr_value(val: Any) -> str:
+    return f"'{val}'" if isinstance(val, str) else repr(val)
+
+
+def _make_repr(cls: type) -> abc.Callable[[Any], str]:
+    # The `__repr__` is compiled once per class as a single f-string over the
+    # annotated fields. Sub-classes that are not decorated can have additional
+    # fields and fall back to `ConfigBase.__repr__`.
+    fields = ", ".join(
+        f"{k}={{_repr_value(_dict[{k!r}])}}" for k in _annotation_types(cls)
+    )
+    src = (
+        "def __repr__(self):\n"
+        "    if type(self) is not cls:\n"
+        "        return base_repr(self)\n"
+        "    _dict = self.to_dict()\n"
+        f'    return f"{{self._class_name}}({fields})"\n'
+    )
+    namespace: dict[str, Any] = {
+        "cls": cls,
+        "base_repr": ConfigBase.__repr__,
+        "_repr_value": _repr_value,
+    }
+    exec(src, namespace)  # pylint: disable=exec-used
+    __repr__ = namespace["__repr__"]
+    __repr__.__qualname__ = f"{cls.__qualname__}.__repr__"
+    __repr__.__doc__ = ConfigBase.__repr__.__doc__
+    return __repr__
+
+
+def _frozen_setattr(self, k, v):
+    if getattr(self, "_freeze", False):
+        raise RuntimeError(
+            f"Can not set attribute {k} on a class of a frozen configuration"
+            f" ``{type(self).__name__}``."
+        )
+    object.__setattr__(self, k, v)
+
 
+# the classes whose `__setattr__` is already replaced by `_frozen_setattr`. Replacing
+# a class attribute invalidates the type caches and is done once per class.
+_PATCHED_CLASSES: weakref.WeakSet = weakref.WeakSet()
+
+
+def _freeze_helper(obj):
     try:
         obj._freeze = True  # pylint: disable=protected-access
-        type(obj).__setattr__ = __setattr__
+        if type(obj) not in _PATCHED_CLASSES:
+            type(obj).__setattr__ = _frozen_setattr
+            _PATCHED_CLASSES.add(type(obj))
     except Exception:  # pylint: disable=broad-exception-caught
         # this is the case where the object does not have
         # attribute setter function
@@ -89,12 +143,23 @@ def _unfreeze_helper(obj):
         super(type(obj), obj).__setattr__("_freeze", False)
 
 
+_PRIMITIVE_TYPES = (int, float, bool, str, type(None))
+
+
+# avoids walking the MRO of the same types with `hasattr`
+@cache_per_class
+def _is_config_cls(cls: type) -> bool:
+    return hasattr(cls, "config_class")
+
+
 def _parse_reconstructor(val, ignore_stateless: bool, flatten: bool):
-    if isinstance(val, (int, float, bool, str, type(None))):
+    if isinstance(val, _PRIMITIVE_TYPES):
         return val
-    if hasattr(type(val), "config_class"):
+    if _is_config_cls(type(val)):
         return val.make_dict(
-            val.annotations, ignore_stateless=ignore_stateless, flatten=flatten
+            _parse_annotations(type(val)),
+            ignore_stateless=ignore_stateless,
+            flatten=flatten,
         )
     if issubclass(type(val), Enum):
         return val.value
@@ -106,12 +171,203 @@ def _parse_reconstructor(val, ignore_stateless: bool, flatten: bool):
     return args, kwargs
 
 
+# pre-allocated `_parse_reconstructor` for each `(ignore_stateless, flatten)` argument.
+_PARSE_RECONSTRUCTORS = {
+    (ignore_stateless, flatten): partial(
+        _parse_reconstructor, ignore_stateless=ignore_stateless, flatten=flatten
+    )
+    for ignore_stateless in (False, True)
+    for flatten in (False, True)
+}
+
+
+def _annotation_types(cls: type) -> dict[str, ty.Any]:
+    # merging in reverse MRO order is equivalent to iterating a `ChainMap`
+    # of the MRO annotations, where the sub-class annotations take precedence.
+    annotation_types: dict[str, ty.Any] = {}
+    if hasattr(cls, "__annotations__"):
+        for c in reversed(cls.__mro__):
+            annotation_types.update(c.__dict__.get("__annotations__", {}))
+    return annotation_types
+
+
+# The annotations are static for each class and are parsed only once.
+@cache_per_class
+def _parse_annotations(cls: type) -> dict[str, Annotation]:
+    return {
+        field_name: parse_type_hint(cls, annotation)
+        for field_name, annotation in _annotation_types(cls).items()
+    }
+
+
+# the fields that require a value, computed once per class. The default values, i.e. the
+# class attributes, are read on every construction as they can be re-assigned.
+@cache_per_class
+def _required_fields(cls: type) -> tuple[str, ...]:
+    return tuple(
+        k
+        for k, annotation in _parse_annotations(cls).items()
+        if not annotation.optional and annotation.state is not Derived
+    )
+
+
+@cache_per_class
+def _non_annotated_variables(cls: type) -> frozenset[str]:
+    # The class variables that are missing an annotation, computed once per class.
+    added_variables = {
+        item[0]
+        for item in inspect.getmembers(cls)
+        if not inspect.isfunction(item[1]) and not item[0].startswith("_")
+    }
+    return frozenset(
+        added_variables - _CONFIGBASE_VARIABLES - _annotation_types(cls).keys()
+    )
+
+
+# the dot paths are parsed once by `operator.attrgetter`
+_attrgetter = functools.lru_cache(maxsize=1024)(operator.attrgetter)
+
+
+@functools.lru_cache(maxsize=1024)
+def _annot_attrgetter(dot_path: str) -> tuple[operator.attrgetter, str]:
+    *base_path, element = dot_path.split(".")
+    annot_dot_path = ".".join(base_path + ["annotations"])
+    return _attrgetter(annot_dot_path), element
+
+
+# (field_name, collection) pairs of the nested configurations and of the remaining
+# custom types (that are frozen with `_freeze_helper`) of each class.
+@cache_per_class
+def _nested_fields(
+    cls: type,
+) -> tuple[tuple[tuple[str, ty.Any], ...], tuple[tuple[str, ty.Any], ...]]:
+    config_fields = []
+    leaf_fields = []
+    for k, annot in _parse_annotations(cls).items():
+        if not isinstance(annot.variable_type, type):
+            continue
+        if hasattr(annot.variable_type, "config_class"):
+            config_fields.append((k, annot.collection))
+        else:
+            leaf_fields.append((k, annot.collection))
+    return tuple(config_fields), tuple(leaf_fields)
+
+
+# whether all the values that determine the `uid` of a class are immutable, such that the
+# digest of a frozen configuration can be cached. Frozen configurations do not prevent
+# modifying the values of collections, custom types or (unfrozen) nested configurations.
+@cache_per_class
+def _immutable_digest(cls: type) -> bool:
+    for annot in _parse_annotations(cls).values():
+        if annot.state is Stateless or annot.collection is Literal:
+            continue
+        if annot.collection is None and annot.variable_type in ALLOWED_TYPES:
+            continue
+        if isinstance(annot.collection, type) and issubclass(annot.collection, Enum):
+            continue
+        return False
+    return True
+
+
+def _iter_field_values(
+    obj: ty.Any, fields: tuple[tuple[str, ty.Any], ...]
+) -> abc.Iterator[ty.Any]:
+    # the values of the fields, where the collections are unpacked.
+    _dict = obj.__dict__
+    for k, collection in fields:
+        if (_val := _dict.get(k)) is None:
+            continue
+        if collection is List or collection is Tuple:
+            yield from _val
+        elif collection is Dict:
+            yield from _val.values()
+        else:
+            yield _val
+
+
+def _make_dict_identity(
+    val, parse_reconstructor: abc.Callable
+):  # pylint: disable=unused-argument
+    return val
+
+
+def _make_dict_list(val, parse_reconstructor: abc.Callable):
+    return [parse_reconstructor(_lval) for _lval in val]
+
+
+def _make_dict_tuple(val, parse_reconstructor: abc.Callable):
+    return tuple(parse_reconstructor(_lval) for _lval in val)
+
+
+def _make_dict_dict(val, parse_reconstructor: abc.Callable):
+    return {k: parse_reconstructor(_dval) for k, _dval in val.items()}
+
+
+def _make_dict_type(val, parse_reconstructor: abc.Callable):
+    # nested configurations and custom types
+    return parse_reconstructor(val)
+
+
+def _make_dict_other(val, parse_reconstructor: abc.Callable):
+    # i.e. Enum collections, where the collection is the Enum class itself
+    if _is_config_cls(type(val)):
+        return parse_reconstructor(val)
+    if issubclass(type(val), Enum):
+        return val.value
+    raise NotImplementedError
+
+
+def _values_differ(left_v: Any, right_v: Any) -> bool:
+    return left_v != right_v or not isinstance(left_v, type(right_v))
+
+
+def _flat_field(field_name: str, annot: Annotation, val: Any) -> dict[str, Any]:
+    # the flattened `make_dict` entries of a single field
+    if val is not None:
+        val = _MAKE_DICT_DISPATCH.get(annot.collection, _make_dict_other)(
+            val, _PARSE_RECONSTRUCTORS[False, True]
+        )
+    return flatten_nested_dict({field_name: val}, deepcopy=False)
+
+
+def _field_differs(
+    field_name: str, annot: Annotation, left_v: Any, right_v: Any
+) -> bool:
+    if left_v is right_v:
+        return False
+    if isinstance(left_v, _PRIMITIVE_TYPES) and isinstance(right_v, _PRIMITIVE_TYPES):
+        return _values_differ(left_v, right_v)
+    if _is_config_cls(type(left_v)) and _is_config_cls(type(right_v)):
+        return left_v != right_v
+    # custom types are compared via their reconstructed representation.
+    left_flat = _flat_field(field_name, annot, left_v)
+    right_flat = _flat_field(field_name, annot, right_v)
+    return left_flat.keys() != right_flat.keys() or any(
+        _values_differ(_v, right_flat[_k]) for _k, _v in left_flat.items()
+    )
+
+
+# `make_dict` handlers for each `Annotation.collection`
+_MAKE_DICT_DISPATCH: dict[ty.Any, abc.Callable] = {
+    None: _make_dict_identity,
+    Literal: _make_dict_identity,
+    List: _make_dict_list,
+    Tuple: _make_dict_tuple,
+    Dict: _make_dict_dict,
+    Type: _make_dict_type,
+}
+
+
 class Missing:
     """
     This type is defined only for raising an error
     """
 
 
+# sentinel for the keys missing from a dictionary, as `None` is a valid value.
+_MISSING = Missing()
+
+
 class ConfigBase:
     """
 
@@ -176,18 +432,21 @@ class ConfigBase:
         self._debug: bool
         self._freeze: bool
         self._class_name: str
+        self._digest_cache: str | None
         self.__setattr__internal("_debug", debug)
         self.__setattr__internal("_freeze", False)
+        self.__setattr__internal("_digest_cache", None)
 
         missing_vals = self._validate_inputs(*args, debug=debug, **kwargs)
 
         assert len(missing_vals) == 0 or debug
-        for k in self.annotations:
+        cls = type(self)
+        for k, annotation in _parse_annotations(type(self)).items():
             if k in kwargs:
                 v = kwargs[k]
                 del kwargs[k]
             else:
-                v = getattr(self, k, None)
+                v = getattr(cls, k, None)
             if k in missing_vals:
                 logging.warning(
                     "Loading %s in `debug` mode. Setting missing required value %s to"
@@ -199,7 +458,7 @@ class ConfigBase:
 
             else:
                 try:
-                    self.__setattr__(k, v)
+                    self._set_checked(k, v, annotation)
                 except Exception as e:  # pylint: disable=broad-exception-caught
                     if not debug:
                         raise e
@@ -224,23 +483,10 @@ class ConfigBase:
             )
 
     def _validate_inputs(self, *args, debug: bool, **kwargs) -> list[str]:
-        added_variables = {
-            item[0]
-            for item in inspect.getmembers(type(self))
-            if not inspect.isfunction(item[1]) and not item[0].startswith("_")
-        }
-
-        base_variables = {
-            item[0]
-            for item in inspect.getmembers(ConfigBase)
-            if not inspect.isfunction(item[1])
-        }
-        non_annotated_variables = (
-            added_variables - base_variables - set(self.annotations.keys())
-        )
+        non_annotated_variables = _non_annotated_variables(type(self))
         assert (
             len(non_annotated_variables) == 0
-        ), f"All variables must be annotated. {non_annotated_variables}"
+        ), f"All variables must be annotated. {set(non_annotated_variables)}"
         if len(args) > 0:
             raise ValueError(
                 f"{self._class_name} does not support positional arguments."
@@ -256,17 +502,14 @@ class ConfigBase:
         return missing_vals
 
     def _validate_missing(self, **kwargs) -> list[str]:
-        missing_vals = []
-        for k, annotation in self.annotations.items():
-            if not annotation.optional and annotation.state not in [Derived]:
-                # make sure non-optional and derived values are not empty or
-                # without a default assignment
-                if not (
-                    (k in kwargs and kwargs[k] is not None)
-                    or getattr(self, k, None) is not None
-                ):
-                    missing_vals.append(k)
-        return missing_vals
+        # make sure non-optional and derived values are not empty or
+        # without a default assignment
+        cls = type(self)
+        return [
+            k
+            for k in _required_fields(cls)
+            if kwargs.get(k) is None and getattr(cls, k, None) is None
+        ]
 
     def __setattr__internal(self, k, v):
         # super(self.config_class, self).__setattr__(k, v)
@@ -278,14 +521,30 @@ class ConfigBase:
                 f"Can not set attribute {k} on frozen configuration"
                 f" ``{type(self).__name__}``."
             )
-        annotation = self.annotations[k]
+        self._set_checked(k, v, _parse_annotations(type(self))[k])
+
+    def _set_checked(self, k, v, annotation: Annotation):
+        # parses and sets the value without checking whether the configuration is frozen
         v = parse_value(v, annotation, k, self._debug)
         self.__setattr__internal(k, v)
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return len(self.diff(other)) == 0
-        return False
+        if self is other:
+            return True
+        if not isinstance(other, self.__class__):
+            return False
+        annotations = _parse_annotations(type(self))
+        if (
+            type(other) is not type(self)
+            and _parse_annotations(type(other)).keys() != annotations.keys()
+        ):
+            return False
+        # equivalent to `len(self.diff(other)) == 0` but compares field by field and
+        # returns on the first difference.
+        return not any(
+            _field_differs(k, annot, self.__dict__.get(k), other.__dict__.get(k))
+            for k, annot in annotations.items()
+        )
 
     def __repr__(self) -> str:
         """
@@ -301,10 +560,7 @@ class ConfigBase:
         return (
             self._class_name
             + "("
-            + ", ".join([
-                f"{k}='{v}'" if isinstance(v, str) else f"{k}={v.__repr__()}"
-                for k, v in self.to_dict().items()
-            ])
+            + ", ".join([f"{k}={_repr_value(v)}" for k, v in self.to_dict().items()])
             + ")"
         )
 
@@ -349,18 +605,8 @@ class ConfigBase:
         dict[str, Annotation]
             A dictionary of parsed annotations.
         """
-        annotations = {}
-        if hasattr(self, "__annotations__"):
-            annotation_types = ChainMap(*(
-                c.__annotations__
-                for c in type(self).__mro__
-                if "__annotations__" in c.__dict__
-            ))
-            annotations = {
-                field_name: parse_type_hint(type(self), annotation)
-                for field_name, annotation in annotation_types.items()
-            }
-        return annotations
+        # a copy, such that modifying it does not affect the cached annotations.
+        return dict(_parse_annotations(type(self)))
 
     def get_val_with_dot_path(self, dot_path: str) -> Any:
         """
@@ -376,7 +622,7 @@ class ConfigBase:
         Any
             The value of the attribute.
         """
-        return operator.attrgetter(dot_path)(self)
+        return _attrgetter(dot_path)(self)
 
     def get_type_with_dot_path(self, dot_path: str) -> Type:
         """
@@ -409,12 +655,10 @@ class ConfigBase:
         Type
             The type of the annotation.
         """
-        *base_path, element = dot_path.split(".")
-        annot_dot_path = ".".join(base_path + ["annotations"])
-        annot: dict[str, Annotation] = self.get_val_with_dot_path(annot_dot_path)
+        annot_getter, element = _annot_attrgetter(dot_path)
+        annot: dict[str, Annotation] = annot_getter(self)
         return annot[element].variable_type
 
-    # pylint: disable=too-complex
     def make_dict(
         self,
         annotations: dict[str, Annotation],
@@ -443,40 +687,25 @@ class ConfigBase:
         NotImplementedError
             If the type of annot.collection is not supported.
         """
-        return_dict = {}
-        parse_reconstructor = partial(
-            _parse_reconstructor, ignore_stateless=ignore_stateless, flatten=flatten
-        )
+        return_dict: dict[str, ty.Any] = {}
+        parse_reconstructor = _PARSE_RECONSTRUCTORS[
+            bool(ignore_stateless), bool(flatten)
+        ]
         for field_name, annot in annotations.items():
             if ignore_stateless and (annot.state in {Stateless, Derived}):
                 continue
 
-            _val = getattr(self, field_name)
-            if annot.collection in [None, Literal] or _val is None:
-                val = _val
-            elif annot.collection == List:
-                val = [parse_reconstructor(_lval) for _lval in _val]
-            elif annot.collection == Tuple:
-                val = tuple(parse_reconstructor(_lval) for _lval in _val)
-            elif annot.collection in [Dict]:
-                val = {k: parse_reconstructor(_dval) for k, _dval in _val.items()}
-            elif hasattr(type(_val), "config_class"):
-                val = _val.make_dict(
-                    _val.annotations, ignore_stateless=ignore_stateless, flatten=flatten
-                )
-
-            elif annot.collection == Type:
-                if annot.optional and _val is None:
-                    val = None
-                else:
-                    val = parse_reconstructor(_val)
-            elif issubclass(type(_val), Enum):
-                val = _val.value
+            # the values are always assigned to the instance `__dict__` in `__init__`
+            if (_val := self.__dict__.get(field_name)) is None:
+                val = None
             else:
-                raise NotImplementedError
+                val = _MAKE_DICT_DISPATCH.get(annot.collection, _make_dict_other)(
+                    _val, parse_reconstructor
+                )
             return_dict[field_name] = val
         if flatten:
-            return_dict = flatten_nested_dict(return_dict)
+            # the values are not copied, as for the `uid`.
+            return_dict = flatten_nested_dict(return_dict, deepcopy=False)
         return return_dict
 
     def write(self, path: Union[Path, str]):
@@ -559,37 +788,26 @@ class ConfigBase:
         In this example, the learning_rate and optimizer values are different between the two configuration objects.
 
         """
-        left_config = copy.deepcopy(self)
-        right_config = copy.deepcopy(config)
-        left_dict = left_config.make_dict(
-            left_config.annotations, ignore_stateless=ignore_stateless, flatten=True
+        left_dict = self.make_dict(
+            _parse_annotations(type(self)),
+            ignore_stateless=ignore_stateless,
+            flatten=True,
         )
 
-        right_dict = right_config.make_dict(
-            right_config.annotations, ignore_stateless=ignore_stateless, flatten=True
+        right_dict = config.make_dict(
+            _parse_annotations(type(config)),
+            ignore_stateless=ignore_stateless,
+            flatten=True,
         )
-        left_keys = set(left_dict.keys())
-        right_keys = set(right_dict.keys())
         diffs: list[tuple[str, tuple[type, ty.Any], tuple[type, ty.Any]]] = []
-        for k in left_keys.union(right_keys):
-            if k not in left_dict:
-                right_v = right_dict[k]
-                right_type = type(right_v)
-                diffs.append((k, (Missing, None), (right_type, right_v)))
-
-            elif k not in right_dict:
-                left_v = left_dict[k]
-                left_type = type(left_v)
-                diffs.append((k, (left_type, left_v), (Missing, None)))
-
-            elif left_dict[k] != right_dict[k] or not isinstance(
-                left_dict[k], type(right_dict[k])
-            ):
-                right_v = right_dict[k]
-                left_v = left_dict[k]
-                left_type = type(left_v)
-                right_type = type(right_v)
-                diffs.append((k, (left_type, left_v), (right_type, right_v)))
+        for k, left_v in left_dict.items():
+            if (right_v := right_dict.get(k, _MISSING)) is _MISSING:
+                diffs.append((k, (type(left_v), left_v), (Missing, None)))
+            elif _values_differ(left_v, right_v):
+                diffs.append((k, (type(left_v), left_v), (type(right_v), right_v)))
+        for k in right_dict.keys() - left_dict.keys():
+            right_v = right_dict[k]
+            diffs.append((k, (Missing, None), (type(right_v), right_v)))
         return diffs
 
     def to_dict(self, ignore_stateless: bool = False) -> dict:
@@ -607,7 +825,9 @@ class ConfigBase:
             The dictionary representation of the configuration object.
 
         """
-        return self.make_dict(self.annotations, ignore_stateless=ignore_stateless)
+        return self.make_dict(
+            _parse_annotations(type(self)), ignore_stateless=ignore_stateless
+        )
 
     def to_yaml(self) -> str:
         """
@@ -619,7 +839,7 @@ class ConfigBase:
             The YAML representation of the configuration object.
 
         """
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=_SafeDumper)
 
     @classmethod
     def from_yaml(cls, yaml_str: str, debug: bool = False) -> Self:
@@ -639,7 +859,7 @@ class ConfigBase:
         Self
             The loaded configuration object.
         """
-        kwargs: dict = yaml.safe_load(yaml_str)
+        kwargs: dict = yaml.load(yaml_str, Loader=_SafeLoader)
         return cls(**kwargs, debug=debug)
 
     def to_dot_path(self, ignore_stateless: bool = False) -> str:
@@ -658,9 +878,11 @@ class ConfigBase:
 
         """
         _flat_dict = self.make_dict(
-            self.annotations, ignore_stateless=ignore_stateless, flatten=True
+            _parse_annotations(type(self)),
+            ignore_stateless=ignore_stateless,
+            flatten=True,
         )
-        return yaml.dump(_flat_dict)
+        return yaml.dump(_flat_dict, Dumper=_SafeDumper)
 
     @property
     def uid(self) -> str:
@@ -673,7 +895,45 @@ class ConfigBase:
             The unique identifier for the configuration object.
 
         """
-        return dict_hash(self.make_dict(self.annotations, ignore_stateless=True))[:5]
+        return self._digest()[:4]
+
+    def _digest(self) -> str:
+        # The full MD5 digest from which the `uid` and `__hash__` are derived.
+        if self._freeze and self._digest_cache is not None:
+            return self._digest_cache
+        # equivalent to `dict_hash` without copying the dictionary returned by `make_dict`
+        flat_dict = flatten_nested_dict(
+            self.make_dict(_parse_annotations(type(self)), ignore_stateless=True),
+            deepcopy=False,
+        )
+        digest = flat_dict_hash(flat_dict, hash_len=32)
+        if self._freeze and _immutable_digest(type(self)):
+            self.__setattr__internal("_digest_cache", digest)
+        return digest
+
+    def __hash__(self) -> int:
+        """
+        The hash of a frozen configuration, derived from the same digest as the ``uid``,
+        such that frozen configurations can be used in a ``set`` or as ``dict`` keys.
+        The values of collections can still be modified while frozen, which changes
+        the hash.
+
+        Returns
+        -------
+        int
+            The hash of the configuration.
+
+        Raises
+        ------
+        TypeError
+            If the configuration is not frozen, as its values can change.
+        """
+        if not self._freeze:
+            raise TypeError(
+                f"unhashable configuration `{self._class_name}`. Only frozen"
+                " configurations are hashable."
+            )
+        return int(self._digest()[:16], 16)
 
     def assert_unambigious(self):
         """
@@ -685,8 +945,8 @@ class ConfigBase:
             If the configuration object is ambiguous or missing required values.
 
         """
-        for k, annot in self.annotations.items():
-            if not annot.optional and getattr(self, k) is None:
+        for k, annot in _parse_annotations(type(self)).items():
+            if not annot.optional and self.__dict__.get(k) is None:
                 raise RuntimeError(
                     f"Ambiguous configuration `{self._class_name}`. Must provide value"
                     f" for {k}"
@@ -701,22 +961,8 @@ class ConfigBase:
         """
         self.__setattr__internal("_freeze", True)
         self._apply_lambda_recursively("freeze")
-
-        for k, annot in self.annotations.items():
-            if (
-                isinstance(annot.variable_type, type)
-                and not hasattr(annot.variable_type, "config_class")
-                and getattr(self, k) is not None
-                and hasattr(getattr(self, k), "__setattr__")
-            ):
-                if annot.collection in [List, Tuple]:
-                    for _lval in getattr(self, k):
-                        _freeze_helper(_lval)
-                elif annot.collection in [Dict]:
-                    for _lval in getattr(self, k).values():
-                        _freeze_helper(_lval)
-                else:
-                    _freeze_helper(getattr(self, k))
+        for _val in _iter_field_values(self, _nested_fields(type(self))[1]):
+            _freeze_helper(_val)
 
     def unfreeze(self):
         """
@@ -725,38 +971,14 @@ class ConfigBase:
         leads to no changes.
         """
         self.__setattr__internal("_freeze", False)
+        self.__setattr__internal("_digest_cache", None)
         self._apply_lambda_recursively("unfreeze")
-
-        for k, annot in self.annotations.items():
-            if (
-                isinstance(annot.variable_type, type)
-                and not hasattr(annot.variable_type, "config_class")
-                and getattr(self, k) is not None
-            ):
-                if annot.collection in [List, Tuple]:
-                    for _lval in getattr(self, k):
-                        _unfreeze_helper(_lval)
-                elif annot.collection in [Dict]:
-                    for _lval in getattr(self, k).values():
-                        _unfreeze_helper(_lval)
-                else:
-                    _unfreeze_helper(getattr(self, k))
+        for _val in _iter_field_values(self, _nested_fields(type(self))[1]):
+            _unfreeze_helper(_val)
 
     def _apply_lambda_recursively(self, lam: str, *args):
-        for k, annot in self.annotations.items():
-            if (
-                isinstance(annot.variable_type, type)
-                and hasattr(annot.variable_type, "config_class")
-                and getattr(self, k) is not None
-            ):
-                if annot.collection in [List, Tuple]:
-                    for _lval in getattr(self, k):
-                        getattr(_lval, lam)(*args)
-                elif annot.collection in [Dict]:
-                    for _lval in getattr(self, k).values():
-                        getattr(_lval, lam)(*args)
-                else:
-                    getattr(getattr(self, k), lam)(*args)
+        for _val in _iter_field_values(self, _nested_fields(type(self))[0]):
+            getattr(_val, lam)(*args)
 
     def expand(self, search_space) -> list[Self]:
         """
@@ -790,21 +1012,22 @@ class ConfigBase:
         ...     attr2: float = 2
         >>> space = SearchSpace(
         ...    {
-        ...        "attr1": Distribution(0, 1, n_bins=4),
-        ...        "attr2": CategoricalDistribution([0,1,2,3,4]),
+        ...        "attr1": Distribution(0, 1, n_bins=1, dtype="int"),
+        ...        "attr2": CategoricalDistribution([0, 4]),
         ...    }
         ... )
         >>> my_config = MyCustomConfig()
         >>> my_config.expand(space)
-        [MyCustomConfig(attr1=0, attr2=0.0), MyCustomConfig(attr1=0, attr2=0.0),
-        MyCustomConfig(attr1=1, attr2=0.0), MyCustomConfig(attr1=0, attr2=4.0),
+        [MyCustomConfig(attr1=0, attr2=0.0), MyCustomConfig(attr1=1, attr2=0.0),
         MyCustomConfig(attr1=0, attr2=4.0), MyCustomConfig(attr1=1, attr2=4.0)]
 
         """
         out_list = []
-        for dot_paths in search_space.expand():
+        base_kwargs = self.to_dict()
+        for dot_paths in search_space.expand_iter():
+            # `augment_trial_kwargs` does not modify `base_kwargs`
             kwargs = augment_trial_kwargs(
-                trial_kwargs=self.to_dict(), augmentation=dot_paths
+                trial_kwargs=base_kwargs, augmentation=dot_paths
             )
             out_list.append(type(self)(**kwargs))
         return out_list
@@ -851,3 +1074,47 @@ class ConfigBase:
             trial_kwargs=self.to_dict(), augmentation=dot_paths
         )
         return type(self)(**kwargs)
+
+    def sample_batch(
+        self, search_space, n: int, sample_fn: abc.Callable | None = None
+    ) -> list[Self]:
+        """
+        Samples ``n`` configurations from the ``search_space``, equivalent to calling
+        ``sample`` ``n`` times. When ``sample_fn`` is left unspecified, the values of each
+        distribution are drawn at once for all ``n`` configurations.
+
+        Parameters
+        ----------
+        search_space : SearchSpace
+            The search space from which to sample the new configurations.
+        n : int
+            The number of configurations to sample.
+        sample_fn : abc.Callable | None, optional
+            The function that can be used to sample values from each distribution, see
+            ``sample``, by default None
+
+        Returns
+        -------
+        list[Self]
+            The sampled configuration objects
+        """
+        out_list = []
+        base_kwargs = self.to_dict()
+        for dot_paths in search_space.sample_batch(n, sample_fn=sample_fn):
+            # `augment_trial_kwargs` does not modify `base_kwargs`
+            kwargs = augment_trial_kwargs(
+                trial_kwargs=base_kwargs, augmentation=dot_paths
+            )
+            out_list.append(type(self)(**kwargs))
+        return out_list
+
+
+# computed once for all decorated classes
+_CONFIGBASE_MEMBERS = tuple(
+    (k, v) for k, v in ConfigBase.__dict__.items() if k != "__dict__"
+)
+_CONFIGBASE_VARIABLES = frozenset(
+    item[0]
+    for item in inspect.getmembers(ConfigBase)
+    if not inspect.isfunction(item[1])
+)
@@ -3,9 +3,58 @@ import typing as ty
 
 
 import copy
+import inspect
+import itertools
+import math
+import weakref
 
 import numpy as np
 
+from config.utils import cache_per_class
+
+_DTYPES: dict[str, type] = {"float": float, "int": int}
+
+
+# the grids of the live distributions, keyed by their parameters. A grid is shared
+# between identical distributions and is released with the last of them.
+_GRIDS: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _make_grid(
+    low: int | float, high: int | float, n_bins: int, log_scale: bool, dtype: type
+) -> np.ndarray:
+    key = (low, high, n_bins, log_scale, dtype)
+    grid = _GRIDS.get(key)
+    if grid is None:
+        grid = _GRIDS[key] = _compute_grid(low, high, n_bins, log_scale, dtype)
+    return grid
+
+
+def _compute_grid(
+    low: int | float, high: int | float, n_bins: int, log_scale: bool, dtype: type
+) -> np.ndarray:
+    # the sorted unique values of a distribution
+    grid: np.ndarray
+    if dtype is int and not log_scale and high - low <= n_bins:
+        # the bins are at most 1 apart and every integer in the range is a value.
+        grid = np.arange(low, high + 1, dtype=dtype)
+        grid.flags.writeable = False
+        return grid
+    if log_scale:
+        # equivalent to `np.geomspace` for positive end-points, without its
+        # handling of negative and complex end-points.
+        space = np.logspace(np.log10(low), np.log10(high), num=n_bins + 1)
+        space[0], space[-1] = low, high
+    else:
+        space = np.linspace(low, high, num=n_bins + 1)
+    grid = np.unique(space.astype(dtype, copy=False))
+    grid.flags.writeable = False
+    return grid
+
+
+# the attributes of `Distribution` that determine its grid.
+_GRID_ATTRS = frozenset(("low", "high", "n_bins", "dtype", "log_scale"))
+
 
 class Distribution:
     """
@@ -46,11 +95,14 @@ class Distribution:
     [0.0, 2.5, 5.0, 7.5, 10.0]
     """
 
+    __slots__ = ("low", "high", "n_bins", "dtype", "log_scale", "_grid")
+
     low: int | float
     high: int | float
     n_bins: int
-    dtype: type = float
-    log_scale: bool = False
+    dtype: type
+    log_scale: bool
+    _grid: np.ndarray | None
 
     def __init__(
         self,
@@ -61,13 +113,12 @@ class Distribution:
         dtype: str = "float",
     ) -> None:
 
-        if dtype not in {"float", "int"}:
+        if dtype not in _DTYPES:
             raise ValueError("Support only for `float` and `int` distribution.")
         self.n_bins = int(n_bins)
         if self.n_bins <= 0:
             raise ValueError("`n_bins` must be greater than 0.")
-        # pylint: disable=eval-used
-        self.dtype = eval(dtype)
+        self.dtype = _DTYPES[dtype]
         self.log_scale = log_scale
 
         self.low = self.dtype(low)
@@ -79,27 +130,62 @@ class Distribution:
                 "Invalid arguments. low>=0 when setting `log_scale` to 'True'"
             )
 
-    def expand(self) -> list[float | int]:
-        space_fn: abc.Callable
-        if not self.log_scale:
-            space_fn = np.linspace
-        else:
-            space_fn = np.geomspace
-        return sorted(
-            list(
-                set(
-                    space_fn(self.low, self.high, num=self.n_bins + 1).astype(
-                        self.dtype
-                    )
-                )
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _GRID_ATTRS:
+            # the grid is computed again on the next access.
+            object.__setattr__(self, "_grid", None)
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        The sorted unique values of the distribution as a read-only array.
+
+        Returns
+        -------
+        np.ndarray
+            The values of the distribution.
+        """
+        if self._grid is None:
+            # the grid is read-only and is shared between identical distributions.
+            self._grid = _make_grid(
+                self.low, self.high, self.n_bins, bool(self.log_scale), self.dtype
             )
-        )
+        return self._grid
+
+    def expand(self) -> list[float | int]:
+        return self.grid.tolist()
 
-    def random_sample(self) -> float | int:
-        return self.dtype(np.random.choice(self.expand()))
+    def random_sample(self, rng: np.random.Generator | None = None) -> float | int:
+        grid = self.grid
+        return self.dtype(grid[_randint(grid.size, rng=rng)])
 
     def contains(self, value: int | float | str) -> bool:
-        return self.dtype(value) >= self.low and self.dtype(value) <= self.high
+        _value = self.dtype(value)
+        return self.low <= _value <= self.high
+
+    def contains_batch(self, values: abc.Iterable[int | float | str]) -> np.ndarray:
+        """
+        The vectorized equivalent of ``contains`` for many values.
+
+        Parameters
+        ----------
+        values : abc.Iterable[int | float | str]
+            The values to check.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array of whether each value is within the range of the distribution.
+        """
+        _values: np.ndarray
+        if isinstance(values, np.ndarray):
+            _values = values.astype(self.dtype)
+        else:
+            # cast each value on its own, as ``contains`` does, such that mixed
+            # numeric and string values are not first coerced to strings.
+            _values = np.fromiter((self.dtype(v) for v in values), dtype=self.dtype)
+        return (_values >= self.low) & (_values <= self.high)
 
 
 class CategoricalDistribution:
@@ -129,6 +215,8 @@ class CategoricalDistribution:
 
     """
 
+    __slots__ = ("choices",)
+
     choices: list
 
     def __init__(self, choices: list[ty.Any]) -> None:
@@ -142,9 +230,8 @@ class CategoricalDistribution:
     def expand(self) -> list:
         return self.choices
 
-    def random_sample(self):
-        idx = np.random.choice(np.arange(len(self.choices)))
-        return self.choices[idx]
+    def random_sample(self, rng: np.random.Generator | None = None):
+        return self.choices[_randint(len(self.choices), rng=rng)]
 
     def contains(self, value):
         return value in self.choices
@@ -185,6 +272,8 @@ class SearchSpace:
     Master(a={'d': 0.0}, d=1.0)
     """
 
+    __slots__ = ("search_space",)
+
     def __init__(
         self, search_space: dict[str, Distribution | CategoricalDistribution]
     ) -> None:
@@ -194,35 +283,142 @@ class SearchSpace:
     def expand(self):
         return expand_dict(self.search_space)
 
+    def expand_iter(self) -> abc.Iterator[dict[str, ty.Any]]:
+        return expand_dict_iter(self.search_space)
+
+    def __iter__(self) -> abc.Iterator[dict[str, ty.Any]]:
+        return self.expand_iter()
+
+    def size(self) -> int:
+        """
+        The number of configurations of the expanded search space, computed without
+        expanding it. Unlike ``len``, it is not bound by ``sys.maxsize``.
+
+        Returns
+        -------
+        int
+            The number of items returned by ``expand``.
+        """
+        return _count_values(self)
+
+    def expand_soa(self) -> dict[str, np.ndarray]:
+        """
+        Expands the search space as ``expand``, but returns a column for each key
+        instead of a dictionary for each configuration, i.e. ``expand_soa()[k][i]`` is
+        equal to ``expand()[i][k]``. Homogeneous primitive values are stored in typed
+        arrays and the remaining values, e.g. nested dictionaries, in ``object`` arrays.
+        An empty search space has no columns, although ``expand`` returns a single empty
+        configuration, see ``size``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The expanded values of each key of the search space.
+        """
+        if len(self.search_space) == 0:
+            return {}
+        per_key_segments = _per_key_segments(self.search_space, {})
+        # the indices of the values of each key, in the same order as `expand`
+        indices: list[list[np.ndarray]] = [[] for _ in per_key_segments]
+        offsets = [
+            np.cumsum([0] + [len(segment) for segment in segments])
+            for segments in per_key_segments
+        ]
+        segment_idxs = [range(len(segments)) for segments in per_key_segments]
+        for idxs in _iter_segments(segment_idxs):
+            sizes = tuple(
+                len(segments[i]) for segments, i in zip(per_key_segments, idxs)
+            )
+            # the indices within the crossed segments, as in `itertools.product`
+            product_idxs = np.unravel_index(np.arange(math.prod(sizes)), sizes)
+            for key_indices, offset, i, product_idx in zip(
+                indices, offsets, idxs, product_idxs
+            ):
+                key_indices.append(offset[i] + product_idx)
+        return {
+            k: _to_array([_v for segment in segments for _v in segment])[
+                np.concatenate(key_indices) if key_indices else []
+            ]
+            for k, segments, key_indices in zip(
+                self.search_space, per_key_segments, indices
+            )
+        }
+
     def sample(
         self,
         sample_fn=None,
         prefix: str = "",
+        rng: np.random.Generator | None = None,
     ):
+        _check_sample_args(sample_fn, rng)
         if sample_fn is None:
-            sample_fn = random_sample
+            return self.sample_batch(1, rng=rng)[0]
 
-        def _sample_params(
-            kwargs,
-            prefix: str = "",
-        ):
+        # the segments of the dot-path to the current item, joined only when passed
+        # to `sample_fn`.
+        path: list[str] = [prefix]
+
+        def _sample_params(kwargs):
             if isinstance(kwargs, CategoricalDistribution):
-                kwargs = sample_fn(name=prefix, dist=kwargs)
+                kwargs = sample_fn(name=".".join(path), dist=kwargs)
+            if isinstance(kwargs, SearchSpace):
+                kwargs = kwargs.search_space
             if isinstance(kwargs, dict):
-                return {
-                    _k: _sample_params(_v, prefix=f"{prefix}.{_k}")
-                    for _k, _v in kwargs.items()
-                }
+                samples = {}
+                for _k, _v in kwargs.items():
+                    path.append(str(_k))
+                    samples[_k] = _sample_params(_v)
+                    path.pop()
+                return samples
             if isinstance(kwargs, Distribution):
-                return sample_fn(name=prefix, dist=kwargs)
-            if isinstance(kwargs, SearchSpace):
-                return {
-                    _k: _sample_params(_v, prefix=f"{prefix}.{_k}")
-                    for _k, _v in kwargs.search_space.items()
-                }
+                return sample_fn(name=".".join(path), dist=kwargs)
             return kwargs
 
-        return _sample_params(self, prefix=prefix)
+        return _sample_params(self)
+
+    def sample_batch(
+        self,
+        n: int,
+        sample_fn=None,
+        prefix: str = "",
+        rng: np.random.Generator | None = None,
+    ) -> list:
+        """
+        Samples ``n`` values from the search space. When ``sample_fn`` is left unspecified,
+        the samples of each distribution are drawn at once, i.e. the search space is
+        traversed once for all ``n`` samples. The chosen values of a
+        ``CategoricalDistribution`` are sampled further, except for a nested
+        ``CategoricalDistribution``, which is returned as it is with or without a
+        ``sample_fn``.
+
+        Parameters
+        ----------
+        n : int
+            The number of samples.
+        sample_fn : abc.Callable | None, optional
+            The function used to select values from each distribution, see ``sample``,
+            by default None
+        prefix : str, optional
+            The prefix of the names passed to ``sample_fn``, by default ""
+        rng : np.random.Generator | None, optional
+            The random generator used when ``sample_fn`` is unspecified. When left
+            unspecified, the global ``np.random`` state is used, by default None
+
+        Returns
+        -------
+        list
+            The ``n`` sampled values of the search space.
+
+        Raises
+        ------
+        ValueError
+            When both ``sample_fn`` and ``rng`` are specified, or when ``rng`` is
+            specified and a sub-class overrides ``random_sample`` without it.
+        """
+        _check_sample_args(sample_fn, rng)
+        if sample_fn is not None:
+            return [self.sample(sample_fn=sample_fn, prefix=prefix) for _ in range(n)]
+        return _sample_batch(self, n, rng)
 
 
 # pylint: disable=unused-argument
@@ -230,6 +426,286 @@ def random_sample(name, dist: Distribution | CategoricalDistribution):
     return dist.random_sample()
 
 
+def _random_sample(
+    dist: Distribution | CategoricalDistribution,
+    rng: np.random.Generator | None = None,
+) -> ty.Any:
+    # sub-classes can override `random_sample` without the `rng` argument.
+    if rng is None:
+        return dist.random_sample()
+    if not _accepts_rng(type(dist)):
+        raise ValueError(
+            f"`rng` is not supported by `{type(dist).__name__}.random_sample`."
+        )
+    return dist.random_sample(rng=rng)
+
+
+# whether `random_sample` has an `rng` argument, computed once per class as
+# `inspect.signature` is slow.
+@cache_per_class
+def _accepts_rng(cls: type) -> bool:
+    random_sample_fn = cls.random_sample  # type: ignore[attr-defined]
+    parameters = inspect.signature(random_sample_fn).parameters.values()
+    return any(
+        p.name == "rng" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters
+    )
+
+
+def _check_sample_args(sample_fn: abc.Callable | None, rng: ty.Any):
+    if sample_fn is not None and rng is not None:
+        raise ValueError("`rng` can not be used together with a `sample_fn`.")
+
+
+# the choices of a `CategoricalDistribution` that are further sampled, i.e. not
+# constants. A `CategoricalDistribution` choice is returned as it is.
+_SAMPLED_TYPES = (Distribution, SearchSpace, dict)
+
+
+def _randint(
+    high: int, size: int | None = None, rng: np.random.Generator | None = None
+) -> ty.Any:
+    # the global `np.random` state is used by default, such that `np.random.seed` applies.
+    if rng is None:
+        return np.random.randint(high, size=size)
+    return rng.integers(high, size=size)
+
+
+def _overrides_random_sample(value: Distribution | CategoricalDistribution) -> bool:
+    # sub-classes can override `random_sample` and are then sampled one at a time.
+    base = (
+        CategoricalDistribution
+        if isinstance(value, CategoricalDistribution)
+        else Distribution
+    )
+    return type(value).random_sample is not base.random_sample
+
+
+def _sample_batch_categorical(
+    value: CategoricalDistribution, n: int, rng: np.random.Generator | None = None
+) -> list:
+    if _overrides_random_sample(value):
+        return [
+            _sample_batch_choice(_random_sample(value, rng), 1, rng)[0]
+            for _ in range(n)
+        ]
+    idxs = _randint(len(value.choices), size=n, rng=rng)
+    if not any(isinstance(choice, _SAMPLED_TYPES) for choice in value.choices):
+        # the choices are constants and are picked with a single indexing op.
+        choices = np.empty(len(value.choices), dtype=object)
+        for i, choice in enumerate(value.choices):
+            choices[i] = choice
+        return choices[idxs].tolist()
+    samples: list = [None] * n
+    for i in np.unique(idxs):
+        (positions,) = np.nonzero(idxs == i)
+        for pos, sample in zip(
+            positions, _sample_batch_choice(value.choices[i], len(positions), rng)
+        ):
+            samples[pos] = sample
+    return samples
+
+
+def _sample_batch_choice(
+    choice, n: int, rng: np.random.Generator | None = None
+) -> list:
+    # as with a `sample_fn`, a chosen `CategoricalDistribution` is not sampled further.
+    if isinstance(choice, CategoricalDistribution):
+        return [choice] * n
+    return _sample_batch(choice, n, rng)
+
+
+def _sample_batch_distribution(
+    value: Distribution, n: int, rng: np.random.Generator | None = None
+) -> list:
+    if _overrides_random_sample(value):
+        return [_random_sample(value, rng) for _ in range(n)]
+    return value.grid[_randint(value.grid.size, size=n, rng=rng)].tolist()
+
+
+def _sample_batch(value, n: int, rng: np.random.Generator | None = None) -> list:
+    # `n` uniformly random samples of `value`, drawn with one call per distribution.
+    if isinstance(value, CategoricalDistribution):
+        return _sample_batch_categorical(value, n, rng)
+    if isinstance(value, SearchSpace):
+        value = value.search_space
+    if isinstance(value, dict):
+        keys = list(value.keys())
+        columns = [_sample_batch(_v, n, rng) for _v in value.values()]
+        if len(keys) == 0:
+            return [{} for _ in range(n)]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+    if isinstance(value, Distribution):
+        return _sample_batch_distribution(value, n, rng)
+    return [value] * n
+
+
+def _segments_for(
+    value: (
+        dict[str, Distribution | CategoricalDistribution | ty.Any]
+        | SearchSpace
+        | ty.Any
+    ),
+    cache: dict[int, list[list]] | None = None,
+) -> list[list]:
+    # the expanded values of a single key of the search space, as segments of values
+    # that are crossed in turn with the remaining keys. Each choice of a
+    # `CategoricalDistribution` is a separate segment. The expansions are cached by `id`
+    # for the sub-trees that are referenced more than once.
+    if cache is None:
+        cache = {}
+    if (segments := cache.get(id(value))) is not None:
+        return segments
+    if (segments_fn := _SEGMENTS_FOR_DISPATCH.get(type(value))) is None:
+        # sub-classes of the dispatched types
+        for value_type, _segments_fn in _SEGMENTS_FOR_DISPATCH.items():
+            if isinstance(value, value_type):
+                segments_fn = _segments_fn
+                break
+        else:
+            return [[value]]
+    segments = cache[id(value)] = segments_fn(value, cache)
+    return segments
+
+
+def _segments_for_dict(
+    value: dict, cache: dict[int, list[list]]
+) -> list[list]:  # pylint: disable=unused-argument
+    return [list(_iter_product(value, _per_key_segments(value, cache)))]
+
+
+def _segments_for_search_space(
+    value: SearchSpace, cache: dict[int, list[list]]
+) -> list[list]:
+    return _segments_for_dict(value.search_space, cache)
+
+
+def _segments_for_distribution(
+    value: Distribution, cache: dict[int, list[list]]
+) -> list[list]:
+    return [value.expand()]
+
+
+def _segments_for_categorical(
+    value: CategoricalDistribution, cache: dict[int, list[list]]
+) -> list[list]:
+    choices = value.expand()
+    if not any(isinstance(choice, _EXPANDED_TYPES) for choice in choices):
+        # the common case, where all choices are constants and expand to themselves.
+        return [[choice] for choice in choices]
+    return [segment for choice in choices for segment in _segments_for(choice, cache)]
+
+
+def _segments_for_list(value: list, cache: dict[int, list[list]]) -> list[list]:
+    return [value]
+
+
+# `_segments_for` handlers for each type of value
+_SEGMENTS_FOR_DISPATCH: dict[
+    type, abc.Callable[[ty.Any, dict[int, list[list]]], list[list]]
+] = {
+    dict: _segments_for_dict,
+    SearchSpace: _segments_for_search_space,
+    Distribution: _segments_for_distribution,
+    CategoricalDistribution: _segments_for_categorical,
+    list: _segments_for_list,
+}
+_EXPANDED_TYPES = tuple(_SEGMENTS_FOR_DISPATCH)
+
+
+def _per_key_segments(
+    search_space: dict[str, Distribution | CategoricalDistribution | ty.Any],
+    cache: dict[int, list[list]],
+) -> list[list[list]]:
+    per_key_segments = []
+    for k, v in search_space.items():
+        try:
+            per_key_segments.append(_segments_for(v, cache))
+        except ValueError as e:
+            raise ValueError(f"Invalid search space for {k}. {str(e)}") from e
+    return per_key_segments
+
+
+def _iter_segments(per_key_segments: abc.Sequence[abc.Sequence]) -> abc.Iterator[tuple]:
+    # the segments of each key that are crossed, in the order of `expand_item` applied
+    # to each key in turn, i.e. where the segments of the last key vary the slowest.
+    for segments in itertools.product(*reversed(per_key_segments)):
+        yield segments[::-1]
+
+
+# the values that are not copied between expanded configurations.
+_IMMUTABLE_TYPES = (int, float, bool, str, bytes, type(None))
+
+
+def _iter_product(
+    search_space: dict[str, Distribution | CategoricalDistribution | ty.Any],
+    per_key_segments: list[list[list]],
+) -> abc.Iterator[dict[str, ty.Any]]:
+    keys = list(search_space.keys())
+    # the mutable values are copied as they are shared between configurations. The keys
+    # with mutable values are found once, so that immutable products are only zipped.
+    mutable_keys = [
+        k
+        for k, segments in zip(keys, per_key_segments)
+        if not all(
+            isinstance(_v, _IMMUTABLE_TYPES) for segment in segments for _v in segment
+        )
+    ]
+    for segments in _iter_segments(per_key_segments):
+        for combo in itertools.product(*segments):
+            _config = dict(zip(keys, combo))
+            # equivalent to `copy.deepcopy(_config)`
+            memo: dict[int, ty.Any] = {}
+            for k in mutable_keys:
+                _config[k] = copy.deepcopy(_config[k], memo)
+            yield _config
+
+
+def _to_array(values: list) -> np.ndarray:
+    value_types = {type(_v) for _v in values}
+    if len(value_types) == 1 and value_types <= {int, float, bool, str}:
+        return np.asarray(values)
+    # filled element-wise such that nested lists and dictionaries are not broadcast.
+    array = np.empty(len(values), dtype=object)
+    for i, _v in enumerate(values):
+        array[i] = _v
+    return array
+
+
+def _count_values(value: ty.Any) -> int:
+    # the total length of `_segments_for(value)` without expanding `value`
+    if isinstance(value, SearchSpace):
+        value = value.search_space
+    if isinstance(value, dict):
+        return math.prod(_count_values(_v) for _v in value.values())
+    if isinstance(value, Distribution):
+        return value.grid.size
+    if isinstance(value, CategoricalDistribution):
+        return sum(_count_values(choice) for choice in value.expand())
+    if isinstance(value, list):
+        return len(value)
+    return 1
+
+
+def _cross(
+    configs: list[dict[str, ty.Any]], key, segments: list[list]
+) -> list[dict[str, ty.Any]]:
+    return [
+        _copy_config({**_config, key: _v})
+        for segment in segments
+        for _config in configs
+        for _v in segment
+    ]
+
+
+def _copy_config(_config: dict[str, ty.Any]) -> dict[str, ty.Any]:
+    # equivalent to `copy.deepcopy(_config)`, where the immutable values are not copied.
+    memo: dict[int, ty.Any] = {}
+    return {
+        k: _v if isinstance(_v, _IMMUTABLE_TYPES) else copy.deepcopy(_v, memo)
+        for k, _v in _config.items()
+    }
+
+
 def expand_item(
     configs: list[dict[str, str | int | float | dict]],
     value: (
@@ -239,35 +715,35 @@ def expand_item(
     ),
     key,
 ) -> list:
-    _configs = []
-    expanded_space: list[ty.Any]
-    if isinstance(value, dict):
-        expanded_space = expand_dict(value)
-    elif isinstance(value, SearchSpace):
-        expanded_space = expand_dict(value.search_space)
-    elif isinstance(value, Distribution):
-        expanded_space = value.expand()
-    elif isinstance(value, CategoricalDistribution):
-        return [c for i in value.expand() for c in expand_item(configs, i, key)]
-    elif isinstance(value, list):
-        expanded_space = value
-    else:
-        expanded_space = [value]
-    for _config in configs:
-        for _v in expanded_space:
-            _config[key] = _v
-            _configs.append(copy.deepcopy(_config))
-    return _configs
+    return _cross(configs, key, _segments_for(value))
+
+
+def expand_dict_iter(
+    search_space: dict[str, Distribution | CategoricalDistribution | ty.Any],
+) -> abc.Iterator[dict[str, ty.Any]]:
+    """
+    Lazily expands the search space as the cartesian product of the values of each key,
+    such that the expanded configurations are not all kept in memory.
+
+    Parameters
+    ----------
+    search_space : dict[str, Distribution | CategoricalDistribution | ty.Any]
+        The search space to expand.
+
+    Yields
+    ------
+    dict[str, ty.Any]
+        The expanded configurations.
+
+    Raises
+    ------
+    ValueError
+        When the search space of a key is invalid.
+    """
+    yield from _iter_product(search_space, _per_key_segments(search_space, {}))
 
 
 def expand_dict(
-    search_space: dict[str, Distribution | CategoricalDistribution | ty.Any]
+    search_space: dict[str, Distribution | CategoricalDistribution | ty.Any],
 ) -> list[dict[str, str | int | float | dict]]:
-    configs: list[dict[str, str | int | float | dict]] = [{}]
-
-    for k, v in search_space.items():
-        try:
-            configs = expand_item(configs, v, k)
-        except ValueError as e:
-            raise ValueError(f"Invalid search space for {k}. {str(e)}") from e
-    return configs
+    return list(expand_dict_iter(search_space))
@@ -2,11 +2,14 @@
 Custom types for runtime checking
 """
 
+import functools
 import typing as ty
 import inspect
 from collections import namedtuple
 from enum import Enum as _Enum
 
+from config.utils import cache_per_class
+
 T = ty.TypeVar("T")
 
 
@@ -431,6 +434,19 @@ def parse_type_hint(cls: ty.Any, type_hint: type[ty.Any]) -> Annotation:
     >>> parse_type_hint(Optional[List[int]])
     Annotation(state=Stateful, optional=True, collection=List, variable_type=int)
     """
+    try:
+        type_hints = _parsed_type_hints(cls)
+        annotation = type_hints.get(type_hint)
+    except TypeError:
+        # e.g. annotations with unhashable metadata or a `cls` that can not be weakly
+        # referenced can not be cached.
+        return _parse_type_hint(cls, type_hint)
+    if annotation is None:
+        annotation = type_hints[type_hint] = _parse_type_hint(cls, type_hint)
+    return annotation
+
+
+def _parse_type_hint(cls: ty.Any, type_hint: type[ty.Any]) -> Annotation:
     state, _type_hint = _strip_hint_state(type_hint)
 
     optional, _type_hint = _strip_hint_optional(_type_hint)
@@ -446,6 +462,14 @@ def parse_type_hint(cls: ty.Any, type_hint: type[ty.Any]) -> Annotation:
     )
 
 
+# type hints are static for each (class, type_hint) pair and are parsed only once.
+@cache_per_class
+def _parsed_type_hints(cls: type) -> dict[ty.Any, Annotation]:
+    # `cls` is only the cache key, the dictionary is filled by `parse_type_hint`.
+    del cls
+    return {}
+
+
 def _parse_class(
     cls: ty.Any, args_kwargs: dict | object, debug: bool = False
 ) -> object:
@@ -482,7 +506,6 @@ def _parse_class(
         and isinstance(args_kwargs[1], dict)
     ):
         # Initializing from *args, **kwargs
-        params = inspect.signature(cls).parameters.keys()
         args = args_kwargs[0]
         kwargs = args_kwargs[1]
     elif isinstance(args_kwargs, dict):
@@ -499,12 +522,18 @@ def _parse_class(
             " kwargs) or (args) or (kwargs)."
         )
 
-    params = inspect.signature(cls).parameters.keys()
-    if "debug" in params:
+    if _accepts_debug(cls):
         kwargs["debug"] = debug
     return cls(*args, **kwargs)
 
 
+# whether the constructor of a class has a `debug` argument, computed once per class as
+# `inspect.signature` is slow.
+@cache_per_class
+def _accepts_debug(cls: type) -> bool:
+    return "debug" in inspect.signature(cls).parameters
+
+
 # pylint: disable=too-complex
 def parse_value(
     val: ty.Any, annot: Annotation, name: str | None = None, debug: bool = False
@@ -547,8 +576,8 @@ def parse_value(
             raise RuntimeError(f"Missing required value for {name}.")
         return None
     if annot.collection is Literal:
-        assert (
-            val in annot.variable_type
+        assert _is_valid_value(
+            val, annot.variable_type, annot.variable_type
         ), f"{val} is not a valid Literal {annot.variable_type}"
         return val
     if annot.collection == Dict and (
@@ -593,13 +622,42 @@ def parse_value(
     if annot.collection is None:
         return annot.variable_type(val)
     if issubclass(annot.collection, Enum):
-        assert (
-            val in annot.variable_type
+        assert _is_valid_value(
+            val, annot.collection, annot.variable_type
         ), f"{val} is not supported by {annot.collection}"
         return annot.collection(val)
     raise NotImplementedError
 
 
+def _is_valid_value(val, key: ty.Any, valid_values: ty.Sequence) -> bool:
+    # membership is checked against a frozenset of the `valid_values` and falls back to
+    # a scan for unhashable values.
+    try:
+        if val in _valid_value_set(key):
+            return True
+    except TypeError:
+        pass
+    return val in valid_values
+
+
+def _valid_value_set(key: ty.Any) -> frozenset:
+    # `key` is either the values of a Literal or an Enum class
+    if isinstance(key, type) and issubclass(key, _Enum):
+        return _enum_value_set(key)
+    return _literal_value_set(key)
+
+
+# the Enum classes are weakly referenced, such that they can be garbage collected.
+@cache_per_class
+def _enum_value_set(cls: type) -> frozenset:
+    return frozenset(_v.value for _v in cls)  # type: ignore[attr-defined]
+
+
+@functools.lru_cache(maxsize=1024)
+def _literal_value_set(values: tuple) -> frozenset:
+    return frozenset(values)
+
+
 class Stateful(ty.Generic[T]):
     """
     This is for attributes that are fixed between saving and loading. By default, we assume that
@@ -3,12 +3,15 @@ import copy
 import hashlib
 import json
 import typing as ty
+import weakref
 from collections import abc
-from functools import reduce
+from functools import reduce, wraps
+
+_T = ty.TypeVar("_T")
 
 
 def flatten_nested_dict(
-    dict_: dict, expand_list: bool = True, seperator: str = "."
+    dict_: dict, expand_list: bool = True, seperator: str = ".", deepcopy: bool = True
 ) -> dict[str, ty.Any]:
     """
     Flattens a nested dictionary, expanding lists and tuples if specified.
@@ -21,6 +24,9 @@ def flatten_nested_dict(
         Whether to expand lists and tuples in the dictionary, by default ``True``.
     seperator : str
         The separator used for joining the keys, by default ``"."``.
+    deepcopy : bool
+        Whether to copy the values of the dictionary, by default ``True``. When ``False``
+        the flattened dictionary shares the values with ``dict_``.
 
     Returns
     -------
@@ -33,7 +39,7 @@ def flatten_nested_dict(
     >>> flatten_nested_dict(nested_dict)
     {'a.b': 1, 'a.c.d': 2, 'e.0': 3, 'e.1': 4}
     """
-    flatten_dict = copy.deepcopy(dict_)
+    flatten_dict = copy.deepcopy(dict_) if deepcopy else dict(dict_)
     for k, v in dict_.items():
         _gen: ty.Optional[abc.Iterable] = None
         if isinstance(v, dict):
@@ -48,7 +54,7 @@ def flatten_nested_dict(
                 flatten_dict[f"{k}{seperator}{_k}"] = _v
 
     if len(flatten_dict) != len(dict_):
-        return flatten_nested_dict(flatten_dict, expand_list, seperator)
+        return flatten_nested_dict(flatten_dict, expand_list, seperator, deepcopy)
     return flatten_dict
 
 
@@ -82,21 +88,71 @@ def dict_hash(
         for _ in dictionaries
     ]
     dictionary = reduce(lambda a, b: {**a, **b}, concat_dictionaries)
-    dhash = hashlib.md5()
-    # We need to sort arguments so {'a': 1, 'b': 2} is
-    # the same as {'b': 2, 'a': 1}
-    dictionary = flatten_nested_dict(dictionary)
+    return flat_dict_hash(
+        flatten_nested_dict(dictionary, deepcopy=False), hash_len=hash_len
+    )
+
+
+# We need to sort arguments so {'a': 1, 'b': 2} is
+# the same as {'b': 2, 'a': 1}
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def flat_dict_hash(flat_dict: dict[str, ty.Any], hash_len: int = 4) -> str:
+    """
+    Calculates the MD5 hash of a flattened dictionary, i.e. the output of
+    ``flatten_nested_dict``. It is equivalent to ``dict_hash`` of the nested dictionary.
+
+    Parameters
+    ----------
+    flat_dict : dict[str, ty.Any]
+        The flattened dictionary to calculate the hash for.
+    hash_len : int
+        The length of the hash to return, by default ``4``.
+
+    Returns
+    -------
+    str
+        The MD5 hash of the dictionary.
+    """
     _dict = {}
-    for k, v in dictionary.items():
+    for k, v in flat_dict.items():
         if not isinstance(v, (bool, str, int, float, type(None))):
             v = getattr(v, "__name__", str(v))
         _dict[k] = v
-
-    encoded = json.dumps(_dict, sort_keys=True).encode()
-    dhash.update(encoded)
+    dhash = hashlib.md5(_HASH_ENCODER.encode(_dict).encode())
     return dhash.hexdigest()[:hash_len]
 
 
+def cache_per_class(fn: abc.Callable[[type], _T]) -> abc.Callable[[type], _T]:
+    """
+    Caches the values of a function of a class, e.g. of properties that are static
+    for each class. The cache holds weak references to the classes, such that they
+    can be garbage collected.
+
+    Parameters
+    ----------
+    fn : abc.Callable[[type], _T]
+        The function to cache, with the class as its only argument.
+
+    Returns
+    -------
+    abc.Callable[[type], _T]
+        The cached function.
+    """
+    cache: weakref.WeakKeyDictionary[type, _T] = weakref.WeakKeyDictionary()
+
+    @wraps(fn)
+    def _cached_fn(cls: type) -> _T:
+        try:
+            return cache[cls]
+        except KeyError:
+            value = cache[cls] = fn(cls)
+            return value
+
+    return _cached_fn
+
+
 # pylint: disable=bare-except
 # flake8: noqa: E722
 def _parse_fn_repr(val, fn_name):
@@ -130,6 +186,33 @@ def _parse_ast_repr(str_repr):
     return args, kwargs
 
 
+# the (args, kwargs) of the representations of each class that are verified to
+# reconstruct an object of the same class. Repeated representations are common e.g. for
+# the same object appearing in a search space many times.
+@cache_per_class
+def _verified_ast_reprs(cls: type) -> dict[str, tuple[tuple, dict]]:
+    # `cls` is only the cache key, the dictionary is filled by `_parse_verified_ast_repr`.
+    del cls
+    return {}
+
+
+_MAX_VERIFIED_AST_REPRS = 4096
+
+
+def _parse_verified_ast_repr(obj_type: type, str_repr: str) -> tuple[tuple, dict]:
+    verified_reprs = _verified_ast_reprs(obj_type)
+    if (args_kwargs := verified_reprs.get(str_repr)) is not None:
+        return args_kwargs
+    args, kwargs = _parse_ast_repr(str_repr)
+    _kwargs = copy.deepcopy(kwargs)
+    _args = copy.deepcopy(args)
+    _args, _kwargs = _parse_ast_repr(repr(obj_type(*_args, **_kwargs)))
+    assert args == _args and kwargs == _kwargs
+    if len(verified_reprs) < _MAX_VERIFIED_AST_REPRS:
+        verified_reprs[str_repr] = args, kwargs
+    return args, kwargs
+
+
 # pylint: disable=bare-except,unnecessary-dunder-call
 # flake8: noqa: E722
 def parse_repr_to_kwargs(
@@ -170,12 +253,10 @@ def parse_repr_to_kwargs(
     except:
         str_repr = str(obj)
     try:
-        args, kwargs = _parse_ast_repr(str_repr)
-        _kwargs = copy.deepcopy(kwargs)
-        _args = copy.deepcopy(args)
-        _args, _kwargs = _parse_ast_repr(type(obj)(*_args, **_kwargs).__repr__())
-        assert args == _args and kwargs == _kwargs
-        return args, kwargs
+        # the cached values are copied as they can be modified by the caller.
+        return copy.deepcopy(
+            _parse_verified_ast_repr(type(obj), str_repr)  # type: ignore[arg-type]
+        )
     except:
         pass
     raise RuntimeError(
@@ -221,7 +302,8 @@ def augment_trial_kwargs(
     ), f"Duplicate tune paths: {set(dot_paths).difference(dot_paths)}"
     for config_dot_path, val in augmentation.items():
         path: list[str] = config_dot_path.split(".")
-        trial_kwargs = nested_set(trial_kwargs, path, val)
+        # `trial_kwargs` is already a copy and is modified in-place
+        _nested_set(trial_kwargs, path, copy.deepcopy(val))
     return trial_kwargs
 
 
@@ -251,7 +333,12 @@ def nested_set(dict_: dict, keys: list[str], value: ty.Any) -> dict:
         The updated dictionary with the new value set.
     """
     original_dict = copy.deepcopy(dict_)
-    x = original_dict
+    _nested_set(original_dict, keys, value)
+    return original_dict
+
+
+def _nested_set(dict_: dict, keys: list[str], value: ty.Any) -> None:
+    x = dict_
     for key in keys[:-1]:
         if key not in x:
             x[key] = {}
@@ -260,4 +347,3 @@ def nested_set(dict_: dict, keys: list[str], value: ty.Any) -> dict:
         x[keys[-1]].update(value)
     else:
         x[keys[-1]] = value
-    return original_dict
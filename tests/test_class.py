@@ -0,0 +1,144 @@
+import copy
+import dataclasses
+import importlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import pytest
+
+ConfigClass = importlib.import_module("config.class").ConfigClass
+
+KEY_PEM = "-----BEGIN KEY-----\nabc\ndef\n-----END KEY-----\n"
+
+
+def test_key_pem():
+    c = ConfigClass(host="localhost", user="root", port=22, key_pem=KEY_PEM)
+    assert c.key_pem == KEY_PEM.replace("\n", "\\n")
+    c2 = ConfigClass(
+        host="localhost", user="root", port=22, key_pem=KEY_PEM.replace("\n", "\\n")
+    )
+    assert c2.key_pem == c.key_pem
+    with pytest.raises(
+        ValueError, match="Must only provide either `key_pem` or `key_file`."
+    ):
+        ConfigClass(host="localhost", user="root", port=22)
+    with pytest.raises(ValueError, match="Invalid port number 0."):
+        ConfigClass(host="localhost", user="root", port=0, key_pem=KEY_PEM)
+    c3 = ConfigClass(host="localhost", user="root", port="22", key_pem=KEY_PEM)
+    assert c3.port == 22 and c3.to_dict() == c.to_dict()
+
+
+def test_key_file(tmp_path: Path):
+    key_file = tmp_path.joinpath("id_rsa")
+    key_file.write_text(KEY_PEM)
+    c = ConfigClass(host="localhost", user="root", port=22, key_file=key_file)
+    assert c.key_pem == KEY_PEM.replace("\n", "\\n")
+    with pytest.raises(
+        ValueError, match="Must only provide either `key_pem` or `key_file`."
+    ):
+        ConfigClass(
+            host="localhost", user="root", port=22, key_file=key_file, key_pem=KEY_PEM
+        )
+    # modifying the file must invalidate the cached key.
+    key_file.write_text(KEY_PEM + "ghi\n")
+    c2 = ConfigClass(host="localhost", user="root", port=22, key_file=key_file)
+    assert c2.key_pem == (KEY_PEM + "ghi\n").replace("\n", "\\n")
+    # line endings are normalized and non-ascii comments are accepted.
+    key_file.write_bytes(("# κλειδί\n" + KEY_PEM).replace("\n", "\r\n").encode())
+    c3 = ConfigClass(host="localhost", user="root", port=22, key_file=key_file)
+    assert c3.key_pem == ("# κλειδί\n" + KEY_PEM).replace("\n", "\\n")
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_key_file_fifo(tmp_path: Path):
+    # pipes report a size of 0 and must be read to their end.
+    key_file = tmp_path.joinpath("id_rsa")
+    os.mkfifo(key_file)
+    writer = threading.Thread(target=key_file.write_text, args=(KEY_PEM,))
+    writer.start()
+    c = ConfigClass(host="localhost", user="root", port=22, key_file=key_file)
+    writer.join()
+    assert c.key_pem == KEY_PEM.replace("\n", "\\n")
+
+
+def test_to_dict():
+    c = ConfigClass(host="localhost", user="root", port=22, key_pem=KEY_PEM)
+    assert c.to_dict() == {
+        "host": "localhost",
+        "user": "root",
+        "port": "22",
+        "key_pem": KEY_PEM.replace("\n", "\\n"),
+        "key_use_agent": "False",
+        "type": "sftp",
+    }
+    assert c.to_dict(_repr=True) == {
+        "host": "localhost",
+        "user": "root",
+        "port": "22",
+        "key_pem": KEY_PEM.replace("\n", "\\n"),
+    }
+    view = c.to_dict(copy=False)
+    assert view == c.to_dict()
+    with pytest.raises(TypeError):
+        view["port"] = "23"
+    assert repr(c) == (
+        f"ConfigClass(host='localhost', user='root', port='22', key_pem='{c.key_pem}')"
+    )
+    c = ConfigClass(host="h", user="u", port=22, key_pem="a\nb")
+    assert repr(c) == "ConfigClass(host='h', user='u', port='22', key_pem='a\\nb')"
+
+
+def test_from_mapping():
+    kwargs = {"host": "localhost", "user": "root", "port": 22, "key_pem": KEY_PEM}
+    c = ConfigClass.from_mapping({**kwargs, "type": "sftp", "key_use_agent": "False"})
+    assert c == ConfigClass(**kwargs)
+    with pytest.raises(TypeError):
+        ConfigClass(**kwargs, type="sftp")
+
+
+def test_from_many(tmp_path: Path):
+    key_file = tmp_path.joinpath("id_rsa")
+    key_file.write_text(KEY_PEM)
+    rows = [
+        {"host": f"host-{i}", "user": "root", "port": 22, "key_file": key_file}
+        for i in range(3)
+    ] + [{"host": "host-3", "user": "root", "port": 22, "key_pem": KEY_PEM, "a": 1}]
+    configs = ConfigClass.from_many(rows)
+    assert [c.host for c in configs] == [f"host-{i}" for i in range(4)]
+    assert len({c.key_pem for c in configs}) == 1
+    assert configs[0] == ConfigClass(
+        host="host-0", user="root", port=22, key_file=key_file
+    )
+    with pytest.raises(
+        ValueError, match="Must only provide either `key_pem` or `key_file`."
+    ):
+        ConfigClass.from_many([{"host": "host", "user": "root", "port": 22}])
+
+
+def test_frozen():
+    c = ConfigClass(host="localhost", user="root", port=22, key_pem=KEY_PEM)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        c.port = 23
+    c2 = ConfigClass(host="localhost", user="root", port="22", key_pem=KEY_PEM)
+    assert c == c2 and hash(c) == hash(c2)
+    assert len({c, c2}) == 1
+    assert [f.name for f in dataclasses.fields(c)] == [
+        "host",
+        "user",
+        "port",
+        "key_pem",
+    ]
+    assert dataclasses.replace(c, port=23).to_dict()["port"] == "23"
+    c3 = pickle.loads(pickle.dumps(c))
+    assert c3 == c and c3.to_dict() == c.to_dict()
+    assert copy.deepcopy(c).to_dict(_repr=True) == c.to_dict(_repr=True)
+
+
+if __name__ == "__main__":
+    from conftest import run_tests_local
+    import conftest
+
+    _locals = locals()
+    run_tests_local(_locals, conftest)
@@ -1,8 +1,11 @@
 import ast
 import copy
+import dataclasses
+import gc
 import io
 from pathlib import Path
 import re
+import weakref
 
 
 import pytest
@@ -18,7 +21,7 @@ from config import (
     Type,
     config,
 )
-from config.types import List
+from config.types import List, Tuple
 from config.utils import parse_repr_to_kwargs
 
 
@@ -381,6 +384,128 @@ def test_freeze_unfreeze():
     c.c2.a1 = 52
     assert c.c2.a1 == 52
 
+    c.freeze()
+    uid = c.uid
+    assert c.uid == uid
+    c.unfreeze()
+    c.c2.a1 = 53
+    assert c.uid != uid
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenPass:
+    a: int = 10
+
+
+@config
+class FrozenFieldConfig:
+    a: FrozenPass = FrozenPass()
+
+
+def test_freeze_frozen_dataclass():
+    c = FrozenFieldConfig()
+    c.freeze()
+    # classes that reject the freeze flag are left untouched.
+    other = FrozenPass()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        other.a = 5  # type: ignore[misc]
+    c.unfreeze()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        c.a.a = 9  # type: ignore[misc]
+
+
+def test_hash():
+    c = SimpleConfig()
+    with pytest.raises(TypeError, match="Only frozen configurations are hashable."):
+        hash(c)
+    c.freeze()
+    other = SimpleConfig()
+    other.freeze()
+    assert hash(c) == hash(other) and len({c, other}) == 1
+    other.unfreeze()
+    other.a1 = 3
+    other.freeze()
+    assert len({c, other}) == 2
+    # the hash is consistent with `__eq__` when the values of a collection change.
+    c = ListConfig(a=[1, 2])
+    c.freeze()
+    c.a.append(3)
+    other = ListConfig(a=[1, 2, 3])
+    other.freeze()
+    assert c == other and hash(c) == hash(other) and other in {c}
+
+
+@config
+class ListConfig:
+    a: List[int]
+
+
+def test_frozen_uid():
+    c = ListConfig(a=[1, 2])
+    c.freeze()
+    uid = c.uid
+    # the values of collections can be modified while frozen.
+    c.a.append(3)
+    assert c.uid != uid and c.uid == ListConfig(a=[1, 2, 3]).uid
+    c = SimpleConfig()
+    c.freeze()
+    assert c.uid == c.uid == SimpleConfig().uid
+
+
+def test_annotations_copy():
+    c = SimpleConfig()
+    c.annotations.clear()
+    assert len(c.annotations) > 0 and SimpleConfig().annotations == c.annotations
+
+
+def test_class_caches_gc():
+    def _make_config():
+        class GCEnum(Enum):
+            A = "a"
+
+        @config
+        class GCConfig:
+            a1: int = 1
+            a2: GCEnum = "a"
+
+        class GCRepr:
+            # without a `__dict__`, such that it is parsed from its representation.
+            __slots__ = ("a",)
+
+            def __init__(self, a=1):
+                self.a = a
+
+            def __repr__(self):
+                return f"GCRepr(a={self.a})"
+
+        c = GCConfig()
+        assert c.uid and c.to_dict() == {"a1": 1, "a2": "a"} and c == GCConfig()
+        assert parse_repr_to_kwargs(GCRepr()) == ((), {"a": 1})
+        return weakref.ref(GCConfig), weakref.ref(GCRepr), weakref.ref(GCEnum)
+
+    refs = _make_config()
+    # the cached values of the collected classes, e.g. their annotations, can reference
+    # other classes that are only collected in the next pass.
+    gc.collect()
+    gc.collect()
+    # the per-class caches must not keep the classes alive.
+    assert all(ref() is None for ref in refs)
+
+
+def test_reassign_default():
+    @config
+    class DefaultConfig:
+        a: int = 1
+
+    class SubDefaultConfig(DefaultConfig):
+        pass
+
+    assert DefaultConfig().a == 1
+    # the defaults are read from the class on every construction.
+    DefaultConfig.a = 7
+    assert DefaultConfig().a == 7
+    assert SubDefaultConfig().a == 7
+
 
 def test_parse_repr():
     for error_class in error_representation_classes:
@@ -516,6 +641,19 @@ def test_debug_load(tmp_path: Path, capture_logger):
     assert nested_c2.b1.a6 is None
 
 
+@config
+class TupleConfig:
+    a: Tuple[int, str] = (1, "a")
+
+
+def test_yaml_tuple(tmp_path: Path):
+    c = TupleConfig()
+    c.write(tmp_path.joinpath("test.yaml"))
+    loaded_c = TupleConfig.load(tmp_path.joinpath("test.yaml"))
+    assert loaded_c == c
+    assert TupleConfig.from_yaml(c.to_yaml()).a == [1, "a"]
+
+
 def test_flatten_nested_dict():
     out = flatten_nested_dict({"a": {"b": 1, "c": {"d": 2}}, "e": [3, 4]}, False, "#")
     assert out == {"e": [3, 4], "a#b": 1, "a#c#d": 2}
@@ -523,6 +661,35 @@ def test_flatten_nested_dict():
     assert out == {"a#b": 1, "e#0": 3, "e#1": 4, "a#c#d": 2}
 
 
+@config
+class DictConfig:
+    d: Dict[int] = {"x": 1}
+
+
+@config
+class ListDictConfig:
+    l: List[DictConfig] = [DictConfig()]
+
+
+def test_flatten_make_dict():
+    # the flattened values follow `flatten_nested_dict`, which stops once the number of
+    # keys no longer changes.
+    c = ListDictConfig()
+    other = ListDictConfig(l=[DictConfig(d={"x": 2})])
+    assert c.to_dot_path() == "l.0:\n  d.x: 1\n"
+    assert c.diff(other) == [("l.0", (dict, {"d.x": 1}), (dict, {"d.x": 2}))]
+    assert c != other
+    assert c == ListDictConfig()
+
+
+def test_package_dir():
+    import config as config_pkg
+
+    names = dir(config_pkg)
+    assert len(names) == len(set(names))
+    assert set(config_pkg.__all__).issubset(names)
+
+
 if __name__ == "__main__":
     from conftest import run_tests_local
     import conftest
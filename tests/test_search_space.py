@@ -1,4 +1,6 @@
+import gc
 import re
+import weakref
 from config.main import config
 from config.search_space.main import (
     CategoricalDistribution,
@@ -67,6 +69,7 @@ def test_expand_search_space():
     assert (
         np.array([a["a"] for a in space.expand()]) == np.linspace(-10, 10, n_bins + 1)
     ).all()
+    assert (space.expand_soa()["a"] == np.linspace(-10, 10, n_bins + 1)).all()
 
     space = SearchSpace(
         {"a": Distribution(-10, 10, n_bins), "b": Distribution(-1, 1, n_bins)}
@@ -114,6 +117,79 @@ def test_expand_search_space():
     assert len(space.expand()) == (
         (n_bins + 1) ** 2 + (n_bins + 1) ** 3 + (n_bins + 1) ** 4
     ) * (n_bins + 1)
+    assert list(space.expand_iter()) == space.expand() == list(space)
+    assert space.size() == len(space.expand())
+    # the number of configurations can exceed `sys.maxsize`
+    huge_space = SearchSpace({str(i): Distribution(0, 1, 99) for i in range(16)})
+    assert huge_space.size() == 100**16 and bool(SearchSpace({"a": []}))
+    columns = space.expand_soa()
+    assert all(
+        columns[k][i] == v
+        for i, _config in enumerate(space.expand())
+        for k, v in _config.items()
+    )
+    # an empty search space has no columns, but expands to a single configuration.
+    empty_space = SearchSpace({})
+    assert empty_space.expand_soa() == {}
+    assert empty_space.expand() == [{}] and empty_space.size() == 1
+
+
+def test_expand_order():
+    # each choice of a categorical distribution is crossed in turn with the
+    # configurations of the preceding keys.
+    space = SearchSpace({
+        "a": CategoricalDistribution([0, 1]),
+        "b": CategoricalDistribution(["x", "y"]),
+    })
+    expected = [(0, "x"), (1, "x"), (0, "y"), (1, "y")]
+    assert [(c["a"], c["b"]) for c in space.expand()] == expected
+    space = SearchSpace({
+        "a": Distribution(0, 1, 1),
+        "b": CategoricalDistribution([0, Distribution(2, 3, 1)]),
+        "c": [4, 5],
+    })
+    expected = [
+        (0.0, 0, 4),
+        (0.0, 0, 5),
+        (1.0, 0, 4),
+        (1.0, 0, 5),
+        (0.0, 2.0, 4),
+        (0.0, 2.0, 5),
+        (0.0, 3.0, 4),
+        (0.0, 3.0, 5),
+        (1.0, 2.0, 4),
+        (1.0, 2.0, 5),
+        (1.0, 3.0, 4),
+        (1.0, 3.0, 5),
+    ]
+    assert [(c["a"], c["b"], c["c"]) for c in space.expand()] == expected
+    assert list(space.expand_iter()) == space.expand()
+    columns = space.expand_soa()
+    assert [tuple(columns[k][i] for k in "abc") for i in range(12)] == expected
+    space = SearchSpace({
+        "a.d": Distribution(0, 1, 1),
+        "d": CategoricalDistribution([0.1, 0.2]),
+    })
+    configs = Master().expand(space)
+    assert [(c.a.d, c.d) for c in configs] == [
+        (0.0, 0.1),
+        (1.0, 0.1),
+        (0.0, 0.2),
+        (1.0, 0.2),
+    ]
+
+
+def test_expand_copies():
+    space = SearchSpace({
+        "a": CategoricalDistribution([0, 1]),
+        "b": {1, 2},
+        "c": Pass(),
+    })
+    configs = space.expand()
+    configs[0]["b"].add(3)
+    configs[0]["c"].a = 11
+    assert configs[1]["b"] == {1, 2} and configs[1]["c"].a == 10
+    assert space.search_space["b"] == {1, 2} and space.search_space["c"].a == 10
 
 
 def test_distribution():
@@ -144,8 +220,18 @@ def test_distribution():
     n_bins = 200
     a = Distribution(-10, 10.01, n_bins)
     assert a.contains(10.001)
+    assert (
+        a.contains_batch([-10.001, -10, "10", 10.001, 10.02])
+        == [False, True, True, True, False]
+    ).all()
     a = Distribution(-10, 10.01, n_bins, dtype="int")
     assert a.contains(10.001)
+    assert (a.contains_batch(np.array([-11, 10.001, 11])) == [False, True, False]).all()
+    mixed = [10.5, "3", -11]
+    assert (a.contains_batch(mixed) == [a.contains(v) for v in mixed]).all()
+    assert (
+        Distribution(-10, 10, n_bins).contains_batch(mixed) == [False, True, False]
+    ).all()
     assert a.high == 10
     assert a.low == -10
     assert len(a.expand()) == 21
@@ -153,9 +239,36 @@ def test_distribution():
 
     a = Distribution(0.1, 10, n_bins, log_scale=True)
     assert (a.expand() == np.geomspace(0.1, 10, n_bins + 1)).all()
+    assert (a.grid == a.expand()).all()
+    with pytest.raises(ValueError, match="read-only"):
+        a.grid[0] = 1
     assert min(a.expand()) == 0.1 and max(a.expand()) == 10
 
 
+def test_distribution_grid_shared():
+    a = Distribution(0, 1, 4)
+    assert a.grid is Distribution(0, 1, 4).grid
+    grid = weakref.ref(a.grid)
+    del a
+    gc.collect()
+    # the grid is released with the last distribution that holds it.
+    assert grid() is None
+
+
+def test_distribution_set_attributes():
+    a = Distribution(0, 1, 4)
+    assert a.expand() == [0, 0.25, 0.5, 0.75, 1]
+    a.high = 2.0
+    assert a.expand() == [0, 0.5, 1, 1.5, 2]
+    assert a.random_sample() in a.expand() and a.contains(1.5)
+    a.n_bins = 2
+    assert a.expand() == [0, 1, 2]
+    a.dtype = int
+    a.log_scale = True
+    a.low = 1
+    assert a.expand() == [1, 2]
+
+
 def test_cat_distribution():
     with pytest.raises(
         ValueError,
@@ -201,6 +314,99 @@ def test_expand_config():
         removed_config.append(c)
     assert len(configs) == 0
 
+    samples = m.sample_batch(s, 100)
+    assert len(samples) == 100 and all(c in removed_config for c in samples)
+
+
+def test_sample_batch():
+    uniform = Distribution(0, 1, 4)
+    uniform_int = Distribution(0, 10, 10, dtype="int")
+    s = SearchSpace({
+        "a": uniform,
+        "b": CategoricalDistribution([
+            {"d": uniform},
+            SearchSpace({"d": uniform, "g": uniform_int}),
+            "c",
+        ]),
+        "d": 0.1,
+    })
+    expanded = s.expand()
+    samples = s.sample_batch(1000)
+    assert len(samples) == 1000
+    assert all(sample in expanded for sample in samples)
+    assert all(type(sample["a"]) is float for sample in samples)
+    # every outcome of the categorical distribution is sampled
+    outcomes = {
+        tuple(sample["b"]) if isinstance(sample["b"], dict) else sample["b"]
+        for sample in samples
+    }
+    assert outcomes == {("d",), ("d", "g"), "c"}
+    assert s.sample() in expanded
+    assert s.sample_batch(10, rng=np.random.default_rng(0)) == s.sample_batch(
+        10, rng=np.random.default_rng(0)
+    )
+
+
+def test_sample_fn():
+    s = SearchSpace({
+        "a": Distribution(0, 1, 2),
+        "b": CategoricalDistribution([
+            {"c": Distribution(0, 1, 2)},
+            SearchSpace({"d": Distribution(0, 1, 2)}),
+        ]),
+    })
+    names = set()
+
+    def sample_fn(name, dist):
+        names.add(name)
+        if isinstance(dist, CategoricalDistribution):
+            return dist.random_sample()
+        return dist.expand()[0]
+
+    samples = s.sample_batch(100, sample_fn=sample_fn)
+    assert all(sample["a"] == 0 for sample in samples)
+    assert names == {".a", ".b", ".b.c", ".b.d"}
+    with pytest.raises(ValueError, match="`rng` can not be used together"):
+        s.sample(sample_fn=sample_fn, rng=np.random.default_rng(0))
+
+
+def test_sample_nested_categorical():
+    # a chosen Distribution is sampled, a chosen CategoricalDistribution is not.
+    nested = CategoricalDistribution([1, 2])
+    uniform = Distribution(0, 1, 2)
+    s = SearchSpace({
+        "a": CategoricalDistribution([nested]),
+        "b": CategoricalDistribution([uniform]),
+    })
+
+    def sample_fn(name, dist):
+        return dist.random_sample()
+
+    for sample in [s.sample(), s.sample(sample_fn=sample_fn), *s.sample_batch(3)]:
+        assert sample["a"] is nested and sample["b"] in uniform.expand()
+
+
+class MaxDistribution(Distribution):
+    def random_sample(self):
+        return self.high
+
+
+class LastCategoricalDistribution(CategoricalDistribution):
+    def random_sample(self):
+        return self.choices[-1]
+
+
+def test_sample_subclass():
+    s = SearchSpace({
+        "a": MaxDistribution(0, 1, 10),
+        "b": LastCategoricalDistribution(["c", {"d": MaxDistribution(0, 2, 10)}]),
+    })
+    assert s.sample() == {"a": 1.0, "b": {"d": 2.0}}
+    assert s.sample_batch(3) == [{"a": 1.0, "b": {"d": 2.0}}] * 3
+    # the overrides do not accept an `rng`.
+    with pytest.raises(ValueError, match="`MaxDistribution.random_sample`"):
+        s.sample(rng=np.random.default_rng(0))
+
 
 if __name__ == "__main__":
     from conftest import run_tests_local
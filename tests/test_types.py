@@ -10,6 +10,7 @@ from config import (
     Tuple,
     config,
 )
+from config.types import parse_type_hint, parse_value
 import pytest
 import re
 
@@ -218,6 +219,36 @@ def test_iterable():
     )
 
 
+def test_parse_value():
+    def _parse(type_hint, val):
+        return parse_value(val, parse_type_hint(None, type_hint), name="a")
+
+    assert _parse(Literal["a", "b"], "b") == "b"
+    with pytest.raises(AssertionError, match="c is not a valid Literal"):
+        _parse(Literal["a", "b"], "c")
+    # unhashable values fall back to scanning the valid values.
+    with pytest.raises(AssertionError, match="is not a valid Literal"):
+        _parse(Literal["a", "b"], ["a"])
+    assert _parse(Dict[int], {1: "2"}) == {"1": 2}
+    assert _parse(Dict[SimpleConfig], {"x": {"a1": 2}})["x"].a1 == 2
+    with pytest.raises(ValueError, match="Invalid type <class 'int'> for x"):
+        _parse(Dict[SimpleConfig], {"x": 1})
+    assert _parse(List[int], ["1", 2]) == [1, 2]
+    assert [c.a1 for c in _parse(List[SimpleConfig], [{"a1": 1}])] == [1]
+    with pytest.raises(ValueError, match="Invalid type <class 'str'> for type List"):
+        _parse(List[int], "1")
+    assert _parse(Tuple[int, str], ("1", 2)) == [1, "2"]
+    assert _parse(SimpleConfig, {"a1": 3}).a1 == 3
+    assert _parse(bool, "false") is False
+    assert _parse(float, "1.5") == 1.5
+    assert _parse(myEnum, "a") == myEnum.A
+    with pytest.raises(AssertionError, match="b is not supported by"):
+        _parse(myEnum, "b")
+    assert _parse(Optional[int], None) is None
+    with pytest.raises(RuntimeError, match="Missing required value for a."):
+        _parse(int, None)
+
+
 if __name__ == "__main__":
     from conftest import run_tests_local
     import conftest